@@ -0,0 +1,287 @@
+// Client side of the docs search dialog, see `src/docs/search.py`.
+//
+// The search index is a content-hashed static asset, so it is fetched at
+// most once per page load and can be served from the browser cache
+// afterwards. In server mode queries go to the backend's `/api/search`
+// instead, see `src/docs/search_server.py`.
+//
+// Typing is debounced, and a query extending the previous one only rescores
+// the documents that matched before. The dialog's client state only ever
+// holds the rows in view: results have a fixed row height, so the window
+// follows from the scroll offset of the `[data-search-results]` container.
+window.buridanSearch = (() => {
+  const DEBOUNCE_MS = 60;
+  const SERVER_DEBOUNCE_MS = 150;
+  // Rows mounted above and below the visible ones.
+  const OVERSCAN = 4;
+  // Results fetched per request in server mode.
+  const PAGE_SIZE = 30;
+  // Prefix expansions per query term, and their weight against exact terms.
+  const MAX_EXPANSIONS = 64;
+  const PREFIX_WEIGHT = 0.7;
+  // BM25 parameters.
+  const K1 = 1.2;
+  const B = 0.75;
+
+  const loads = new Map();
+  let index = null;
+  let stopWords = new Set();
+  let setWindow = null;
+  let rowHeight = 40;
+  let lastQuery = "";
+  let timer = null;
+  // The documents matched by the previous query, for narrowing.
+  let previous = null;
+  // Everything the current query matched, best first, and the rows in view.
+  let ranked = [];
+  let shown = null;
+  // Server mode.
+  let endpoint = null;
+  let pending = null;
+  let serverTotal = 0;
+
+  function fetchJson(url, options) {
+    return fetch(url, options).then((response) => {
+      if (!response.ok) {
+        throw new Error(`${response.status} ${response.statusText}`);
+      }
+      return response.json();
+    });
+  }
+
+  function loadIndex(url) {
+    if (!loads.has(url)) {
+      const request = fetchJson(url);
+      // Allow a retry the next time the dialog opens.
+      request.catch(() => loads.delete(url));
+      loads.set(url, request);
+    }
+    return loads.get(url);
+  }
+
+  function tokenize(text) {
+    return (text.toLowerCase().match(/[a-z0-9]+/g) || []).filter(
+      (token) => !stopWords.has(token),
+    );
+  }
+
+  // Index of the first term >= prefix in the sorted term list.
+  function lowerBound(terms, prefix) {
+    let low = 0;
+    let high = terms.length;
+    while (low < high) {
+      const mid = (low + high) >> 1;
+      if (terms[mid] < prefix) low = mid + 1;
+      else high = mid;
+    }
+    return low;
+  }
+
+  // The terms starting with `token`, and whether there were more than
+  // MAX_EXPANSIONS of them.
+  function expand(token) {
+    const terms = index.terms;
+    const matches = [];
+    let i = lowerBound(terms, token);
+    for (; i < terms.length && terms[i].startsWith(token); i++) {
+      if (matches.length === MAX_EXPANSIONS) return { matches, capped: true };
+      matches.push([i, terms[i] === token ? 1 : PREFIX_WEIGHT]);
+    }
+    return { matches, capped: false };
+  }
+
+  // Best BM25 score per document for the expansions of one query term,
+  // among `candidates` when given.
+  function scoreToken(matches, candidates) {
+    const docCount = index.docs.length;
+    const scores = new Map();
+    for (const [term, weight] of matches) {
+      const postings = index.postings[term];
+      const frequency = postings.length / 2;
+      const idf = Math.log(1 + (docCount - frequency + 0.5) / (frequency + 0.5));
+      for (let i = 0; i < postings.length; i += 2) {
+        const doc = postings[i];
+        if (candidates && !candidates.has(doc)) continue;
+        const tf = postings[i + 1];
+        const norm = 1 - B + (B * index.lengths[doc]) / index.avgLength;
+        const score = (weight * idf * tf * (K1 + 1)) / (tf + K1 * norm);
+        if (score > (scores.get(doc) || 0)) scores.set(doc, score);
+      }
+    }
+    return scores;
+  }
+
+  // Every term of the previous query is a prefix of the same term now, so
+  // the new matches are a subset of the previous ones. Unless a term had
+  // more expansions than were scored: the previous matches then miss
+  // documents that only contain the terms left out.
+  function narrows(tokens) {
+    return (
+      previous !== null &&
+      !previous.capped &&
+      tokens.length >= previous.tokens.length &&
+      previous.tokens.every((token, i) => tokens[i].startsWith(token))
+    );
+  }
+
+  // Documents matching every term of the query, best first.
+  function search(query) {
+    const tokens = tokenize(query);
+    if (!tokens.length) {
+      previous = null;
+      return null;
+    }
+
+    const allowed = narrows(tokens) ? previous.docs : null;
+    let scores = null;
+    let capped = false;
+    for (const token of tokens) {
+      const expansions = expand(token);
+      capped = capped || expansions.capped;
+      const next = scoreToken(expansions.matches, scores || allowed);
+      if (scores) {
+        for (const [doc, score] of next) next.set(doc, score + scores.get(doc));
+      }
+      scores = next;
+    }
+    previous = { tokens, docs: scores, capped };
+    return [...scores].sort((a, b) => b[1] - a[1]).map(([doc]) => doc);
+  }
+
+  function result(doc) {
+    const [title, url, heading] = index.docs[doc];
+    const anchor = heading ? `#${encodeURIComponent(heading)}` : "";
+    return { title, url, heading, href: `/${url}${anchor}` };
+  }
+
+  // Every page, in sidebar order, for an empty query.
+  function pages() {
+    return index.docs.flatMap((doc, i) => (doc[2] ? [] : [i]));
+  }
+
+  function container() {
+    return document.querySelector("[data-search-results]");
+  }
+
+  // Hands the rows in view to the dialog.
+  function render() {
+    if (!setWindow) return;
+    const element = container();
+    const top = element ? element.scrollTop : 0;
+    const height = element ? element.clientHeight : 0;
+    const start = Math.max(0, Math.floor(top / rowHeight) - OVERSCAN);
+    const end = Math.min(ranked.length, Math.ceil((top + height) / rowHeight) + OVERSCAN);
+    if (shown && shown.list === ranked && shown.start === start && shown.end === end) {
+      return;
+    }
+    shown = { list: ranked, start, end };
+
+    const rows = ranked.slice(start, end);
+    setWindow({
+      rows: endpoint ? rows : rows.map(result),
+      offset: start * rowHeight,
+      height: (endpoint ? serverTotal : ranked.length) * rowHeight,
+    });
+    if (endpoint && end >= ranked.length - OVERSCAN && ranked.length < serverTotal) {
+      fetchServerPage();
+    }
+  }
+
+  function show(list) {
+    ranked = list;
+    shown = null;
+    const element = container();
+    if (element) element.scrollTop = 0;
+    render();
+  }
+
+  function runQuery() {
+    timer = null;
+    if (endpoint) {
+      queryServer();
+    } else if (index) {
+      show(search(lastQuery) || pages());
+    }
+  }
+
+  function queryServer() {
+    // Only the latest query may set the results.
+    if (pending) pending.abort();
+    pending = null;
+    serverTotal = 0;
+    show([]);
+    fetchServerPage();
+  }
+
+  function fetchServerPage() {
+    if (pending) return;
+    const controller = new AbortController();
+    pending = controller;
+    const params = new URLSearchParams({
+      q: lastQuery,
+      page: String(Math.floor(ranked.length / PAGE_SIZE)),
+      page_size: String(PAGE_SIZE),
+    });
+    const list = ranked;
+    fetchJson(`${endpoint}?${params}`, { signal: controller.signal })
+      .then((data) => {
+        pending = null;
+        if (list !== ranked) return;
+        serverTotal = data.total;
+        ranked = ranked.concat(data.results);
+        shown = null;
+        render();
+      })
+      .catch((error) => {
+        if (error.name === "AbortError") return;
+        pending = null;
+        console.warn("Search request failed:", error);
+      });
+  }
+
+  function query(text) {
+    // Typed before the index arrived, it runs once loaded.
+    lastQuery = text;
+    if (timer) clearTimeout(timer);
+    timer = setTimeout(runQuery, endpoint ? SERVER_DEBOUNCE_MS : DEBOUNCE_MS);
+  }
+
+  // Scroll events do not bubble, so listen for them while capturing.
+  document.addEventListener(
+    "scroll",
+    (event) => {
+      if (event.target instanceof Element && event.target.matches("[data-search-results]")) {
+        render();
+      }
+    },
+    true,
+  );
+
+  // `source` is `{index}` with the URL of the index asset or the index
+  // itself, or `{endpoint}` in server mode.
+  function open(source, setter) {
+    setWindow = setter;
+    rowHeight = source.rowHeight;
+    lastQuery = "";
+    previous = null;
+    if (timer) clearTimeout(timer);
+    timer = null;
+
+    if (source.endpoint) {
+      endpoint = source.endpoint;
+      queryServer();
+      return;
+    }
+    const loaded =
+      typeof source.index === "string" ? loadIndex(source.index) : Promise.resolve(source.index);
+    loaded
+      .then((data) => {
+        index = data;
+        stopWords = new Set(data.stopWords);
+        runQuery();
+      })
+      .catch((error) => console.warn("Could not load the search index:", error));
+  }
+
+  return { open, query, search };
+})();
@@ -0,0 +1,64 @@
+// Shared controller for the code blocks of doc pages.
+//
+// Listings are published at build time as content-hashed files under
+// /sources/ (`<key>.json`, with the highlighted `html` and the raw `text`),
+// so they never change and each one is fetched at most once per visit.
+// Copy buttons carry the content key in `data-copy`, with a counter suffix
+// when the same listing appears more than once, so only the clicked one is
+// flagged as copied.
+window.buridanSources = window.buridanSources || (() => {
+  const cache = new Map();
+
+  const load = (key) => {
+    if (!cache.has(key)) {
+      const request = fetch(`/sources/${key}.json`).then((response) => {
+        if (!response.ok) {
+          throw new Error(`Failed to load source ${key}: ${response.status}`);
+        }
+        return response.json();
+      });
+      // Forget failed requests, so opening the tab again retries.
+      request.catch(() => cache.delete(key));
+      cache.set(key, request);
+    }
+    return cache.get(key);
+  };
+
+  const markCopied = (copyId) => {
+    document.querySelectorAll(`[data-copy="${copyId}"]`).forEach((button) => {
+      button.dataset.copied = "";
+      clearTimeout(button.copiedTimeout);
+      button.copiedTimeout = setTimeout(() => {
+        delete button.dataset.copied;
+      }, 1500);
+    });
+  };
+
+  return {
+    markCopied,
+    render(key) {
+      return load(key).then(({ html }) => {
+        document
+          .querySelectorAll(`[data-source="${key}"]`)
+          .forEach((element) => {
+            element.innerHTML = html;
+          });
+      });
+    },
+    copy(key, copyId = key) {
+      markCopied(copyId);
+      const text = load(key).then(({ text }) => text);
+      // Passing the pending text keeps the click's user activation in Safari.
+      if (window.ClipboardItem && navigator.clipboard.write) {
+        return navigator.clipboard.write([
+          new ClipboardItem({
+            "text/plain": text.then(
+              (value) => new Blob([value], { type: "text/plain" }),
+            ),
+          }),
+        ]);
+      }
+      return text.then((value) => navigator.clipboard.writeText(value));
+    },
+  };
+})();
@@ -0,0 +1,79 @@
+"""The lock file recording what the CLI installed into a project, see `cli/main.py`."""
+
+import os
+import json
+import pathlib
+
+import typer
+
+LOCK_VERSION = 1
+LOCK_FILE_NAME = "buridan.lock"
+
+# File states, comparing a project file with the library and the lock.
+UP_TO_DATE = "up to date"
+OUTDATED = "outdated"
+MODIFIED = "modified"
+MISSING = "missing"
+
+
+class LockFile:
+    """The components added to a project and the hashes of their files.
+
+    `files` maps every installed file, relative to the project root, to the
+    sha256 it had when the CLI last wrote it. A file whose content still has
+    that hash was not edited since, so it can be updated safely.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        data = self._read()
+        self.components: set[str] = set(data.get("components", []))
+        self.wrapped_react: set[str] = set(data.get("wrapped_react", []))
+        self.files: dict[str, str] = data.get("files", {})
+
+    def _read(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            typer.secho(
+                f"Warning: Could not read {self.path}, starting a new one: {e}",
+                fg=typer.colors.YELLOW,
+            )
+            return {}
+        if data.get("version") != LOCK_VERSION:
+            typer.secho(
+                f"Warning: Unsupported lock file version in {self.path}, ignoring it.",
+                fg=typer.colors.YELLOW,
+            )
+            return {}
+        return data
+
+    def write(self):
+        """Writes the lock file, replacing it in one step."""
+        data = {
+            "version": LOCK_VERSION,
+            "components": sorted(self.components),
+            "wrapped_react": sorted(self.wrapped_react),
+            "files": dict(sorted(self.files.items())),
+        }
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2) + "\n")
+        os.replace(tmp_path, self.path)
+
+
+def file_status(local_hash: str | None, locked_hash: str | None, library_hash: str):
+    """How a project file compares with the library.
+
+    A file that differs from the library is `outdated` if it is still what
+    the CLI installed, and `modified` if it was edited (or never installed
+    by the CLI).
+    """
+    if local_hash is None:
+        return MISSING
+    if local_hash == library_hash:
+        return UP_TO_DATE
+    if local_hash == locked_hash:
+        return OUTDATED
+    return MODIFIED
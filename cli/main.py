@@ -3,7 +3,25 @@ import pathlib
 import shutil
 import ast
 import subprocess
-import re
+import os
+import time
+import json
+import difflib
+import importlib.resources
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from cli.lock import (
+    LOCK_FILE_NAME,
+    MISSING,
+    MODIFIED,
+    OUTDATED,
+    UP_TO_DATE,
+    LockFile,
+    file_status,
+)
+from cli.manifest import MANIFEST_FILE, MANIFEST_VERSION, file_hash
 
 app = typer.Typer()
 add_app = typer.Typer()
@@ -13,21 +31,57 @@ app.add_typer(add_app, name="add")
 REPO_URL = "https://github.com/buridan-ui/ui.git"
 CACHE_DIR = pathlib.Path.home() / ".buridan" / "repo"
 
-# Source directories from the cloned repo
-BASE_UI_DIR = CACHE_DIR / "src" / "docs" / "library" / "base_ui"
-BASE_UI_COMPONENTS_DIR = BASE_UI_DIR / "components"
-BASE_UI_BASE_COMPONENTS_DIR = BASE_UI_COMPONENTS_DIR / "base"
-BASE_UI_ICONS_DIR = BASE_UI_DIR / "icons"
-BASE_UI_UTILS_DIR = BASE_UI_DIR / "utils"
-
-WRAPPED_COMPONENTS_DIR = CACHE_DIR / "src" / "docs" / "library" / "wrapped_components"
-THEMES_CSS_FILE = CACHE_DIR / "assets" / "css" / "wrapper.css"
+# The installed distribution ships the repository's `src` package, and with
+# it the component library and its manifest, see `cli/manifest.py`.
+LIBRARY_PACKAGE = "src"
+BASE_UI_SOURCE_DIR = pathlib.PurePosixPath("src/docs/library/base_ui")
+
+# The only parts of the repository the CLI copies from, the cache is a sparse
+# checkout of these (gitignore-style patterns).
+SPARSE_PATHS = [
+    "/src/docs/library/base_ui/",
+    "/src/docs/library/wrapped_components/",
+    "/assets/css/wrapper.css",
+    f"/{MANIFEST_FILE.as_posix()}",
+]
+
+# Touched on every sync, holds the sparse paths the cache was synced with.
+SYNC_STAMP_FILE = CACHE_DIR.parent / "last_sync"
+DEFAULT_SYNC_TTL = 3600
+
+# Files copied at once when adding components.
+COPY_WORKERS = 8
+
+# Global options, set by `main`. `library` is where files are read from,
+# "package" or "repo", set by `_select_library`.
+_options = {"offline": False, "latest": False, "library": "package"}
+
+
+@app.callback()
+def main(
+    latest: bool = typer.Option(
+        False,
+        "--latest",
+        help="Use the latest component library from the git repository "
+        "instead of the one installed with buridan-ui.",
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        help="Use the cached repository as-is, without syncing it.",
+    ),
+):
+    """
+    Add Buridan UI components and themes to your Reflex project.
+    """
+    _options["latest"] = latest
+    _options["offline"] = offline
 
 
 def _run_git_command(command: list[str], cwd: pathlib.Path | None = None):
     """Runs a git command and handles errors."""
     try:
-        subprocess.run(command, check=True, capture_output=True, text=True)
+        subprocess.run(command, cwd=cwd, check=True, capture_output=True, text=True)
     except FileNotFoundError:
         typer.secho(
             "Error: git is not installed. Please install git to use this feature.",
@@ -39,199 +93,339 @@ def _run_git_command(command: list[str], cwd: pathlib.Path | None = None):
         raise typer.Exit(1)
 
 
+def _sync_ttl() -> int:
+    """Seconds a synced cache counts as fresh, set with BURIDAN_SYNC_TTL."""
+    value = os.environ.get("BURIDAN_SYNC_TTL", str(DEFAULT_SYNC_TTL))
+    if value.isdigit():
+        return int(value)
+    typer.secho(
+        f"Warning: Invalid BURIDAN_SYNC_TTL value: {value}", fg=typer.colors.YELLOW
+    )
+    return DEFAULT_SYNC_TTL
+
+
+def _cache_is_fresh() -> bool:
+    """Whether the cache was synced within the TTL, with the current sparse paths."""
+    if not CACHE_DIR.exists():
+        return False
+    try:
+        synced_paths = SYNC_STAMP_FILE.read_text().splitlines()
+        age = time.time() - SYNC_STAMP_FILE.stat().st_mtime
+    except OSError:
+        return False
+    return synced_paths == SPARSE_PATHS and age < _sync_ttl()
+
+
+def _clone_repo():
+    """Makes a shallow, sparse clone of the repository into the cache.
+
+    Blobs are only fetched for the sparse paths, and the clone is moved into
+    place once complete, so an interrupted clone never leaves a broken cache.
+    """
+    typer.echo(f"Cloning repository into {CACHE_DIR}...")
+    tmp_dir = CACHE_DIR.with_name(f"{CACHE_DIR.name}.tmp")
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    CACHE_DIR.parent.mkdir(parents=True, exist_ok=True)
+    _run_git_command(
+        [
+            "git",
+            "clone",
+            "--depth",
+            "1",
+            "--filter=blob:none",
+            "--no-checkout",
+            REPO_URL,
+            str(tmp_dir),
+        ]
+    )
+    _run_git_command(
+        ["git", "sparse-checkout", "set", "--no-cone", *SPARSE_PATHS], cwd=tmp_dir
+    )
+    _run_git_command(["git", "checkout"], cwd=tmp_dir)
+    tmp_dir.rename(CACHE_DIR)
+
+
 def _update_repo():
-    """Clones or pulls the Buridan UI repository."""
+    """Syncs the cached copy of the Buridan UI repository.
+
+    A sync fetches only the latest commit of the sparse paths. It is skipped
+    when the cache was synced within BURIDAN_SYNC_TTL seconds (default one
+    hour), and with `--offline`.
+    """
+    if _options["offline"]:
+        if not CACHE_DIR.exists():
+            typer.secho(
+                "Error: No cached component library, run once without --offline.",
+                fg=typer.colors.RED,
+            )
+            raise typer.Exit(1)
+        return
+    if _cache_is_fresh():
+        return
+
     typer.secho("Updating component library...", fg=typer.colors.YELLOW)
     if not CACHE_DIR.exists():
-        typer.echo(f"Cloning repository into {CACHE_DIR}...")
-        CACHE_DIR.parent.mkdir(parents=True, exist_ok=True)
-        _run_git_command(["git", "clone", REPO_URL, str(CACHE_DIR)])
+        _clone_repo()
     else:
-        typer.echo(f"Pulling latest changes in {CACHE_DIR}...")
-        _run_git_command(["git", "-C", str(CACHE_DIR), "pull"])
+        typer.echo(f"Fetching latest changes in {CACHE_DIR}...")
+        # Also narrows caches made by full clones of older versions.
+        _run_git_command(
+            ["git", "sparse-checkout", "set", "--no-cone", *SPARSE_PATHS],
+            cwd=CACHE_DIR,
+        )
+        _run_git_command(
+            ["git", "fetch", "--depth", "1", "origin", "HEAD"], cwd=CACHE_DIR
+        )
+        _run_git_command(["git", "reset", "--hard", "FETCH_HEAD"], cwd=CACHE_DIR)
+    SYNC_STAMP_FILE.write_text("\n".join(SPARSE_PATHS))
     typer.secho("Component library is up to date.", fg=typer.colors.GREEN)
 
 
-def _find_base_ui_component_imports(file_path: pathlib.Path) -> list[str]:
-    """Parses a Python file and returns a list of local component dependencies."""
-    if not file_path.exists():
-        return []
-    content = file_path.read_text()
-    tree = ast.parse(content)
-    dependencies = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ImportFrom) and node.level == 1:
-            # Assuming level 1 imports are peer dependencies in the same 'base' directory
-            if node.module:
-                dependencies.append(node.module)
-    return list(set(dependencies))
-
-
-def _copy_base_ui_scaffolding(app_root_dir: pathlib.Path):
-    """Copies the base UI scaffolding (utils, icons, and base component files)."""
-    dest_dir = app_root_dir / "components" / "ui"
-    dest_dir.mkdir(parents=True, exist_ok=True)
-    (dest_dir.parent / "__init__.py").touch()
-    (dest_dir / "__init__.py").touch()
-
-    # Copy icons and utils directories
-    icons_dest = dest_dir / "icons"
-    if not icons_dest.exists():
-        shutil.copytree(BASE_UI_ICONS_DIR, icons_dest)
-        typer.secho(
-            f"  - Added icons to {icons_dest.relative_to(pathlib.Path.cwd())}",
-            fg=typer.colors.BLUE,
-        )
+def _packaged_library_available() -> bool:
+    try:
+        root = importlib.resources.files(LIBRARY_PACKAGE)
+    except ModuleNotFoundError:
+        return False
+    return root.joinpath(*MANIFEST_FILE.parts[1:]).is_file()
+
 
-    utils_dest = dest_dir / "utils"
-    if not utils_dest.exists():
-        shutil.copytree(BASE_UI_UTILS_DIR, utils_dest)
+def _select_library():
+    """Picks where the component library is read from.
+
+    The installed buridan-ui package ships the library, so by default nothing
+    is fetched and git is not needed. With `--latest`, or if the package
+    has no library, the cached repository is synced and used instead.
+    """
+    if not _options["latest"]:
+        if _packaged_library_available():
+            _options["library"] = "package"
+            return
         typer.secho(
-            f"  - Added utils to {utils_dest.relative_to(pathlib.Path.cwd())}",
-            fg=typer.colors.BLUE,
+            "The installed buridan-ui package has no component library, "
+            "using the repository.",
+            fg=typer.colors.YELLOW,
         )
+    _update_repo()
+    _options["library"] = "repo"
 
-    # Copy base_ui.py and component.py
-    for base_file in ["base_ui.py", "component.py"]:
-        source = BASE_UI_COMPONENTS_DIR / base_file
-        dest = dest_dir / base_file
-        if not dest.exists():
-            shutil.copy(source, dest)
-            typer.secho(
-                f"  - Added base file '{base_file}' to {dest.relative_to(pathlib.Path.cwd())}",
-                fg=typer.colors.BLUE,
-            )
-
-    # Ensure base component directory exists
-    (dest_dir / "base").mkdir(exist_ok=True)
-    (dest_dir / "base" / "__init__.py").touch()
 
+def _library_file(file: str):
+    """A file of the component library, by its path in the repository."""
+    if _options["library"] == "package":
+        parts = pathlib.PurePosixPath(file).parts
+        return importlib.resources.files(LIBRARY_PACKAGE).joinpath(*parts[1:])
+    return CACHE_DIR / file
 
-def _add_base_ui_component(
-    component_name: str, added_items: set, app_root_dir: pathlib.Path
-):
-    """Adds a single base_ui component and its dependencies."""
-    if component_name in added_items:
-        return
 
-    source_file = BASE_UI_BASE_COMPONENTS_DIR / f"{component_name}.py"
-    if not source_file.exists():
+def _load_manifest() -> dict:
+    """Reads the component manifest of the selected library."""
+    manifest_file = _library_file(MANIFEST_FILE.as_posix())
+    try:
+        manifest = json.loads(manifest_file.read_text())
+    except (OSError, ValueError):
         typer.secho(
-            f"Component '{component_name}' not found in base_ui components.",
+            f"Error: Component manifest not found at {manifest_file}.",
             fg=typer.colors.RED,
         )
-        # Check for older components for backward compatibility
-        old_source_file = (
-            CACHE_DIR
-            / "src"
-            / "docs"
-            / "library"
-            / "components"
-            / component_name
-            / f"{component_name}.py"
-        )
-        if old_source_file.exists():
+        if _options["offline"]:
             typer.secho(
-                f"Note: '{component_name}' seems to be an older component. Please check its dependencies manually.",
-                fg=typer.colors.YELLOW,
+                "(run the command without --offline to sync the library)",
+                fg=typer.colors.RED,
             )
-            # Fallback to old logic if needed, or just inform user. For now, just informing.
-        return
+        raise typer.Exit(1)
+    if manifest.get("version") != MANIFEST_VERSION:
+        typer.secho(
+            "Error: The component library needs a newer version of the CLI, "
+            "please upgrade buridan-ui.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+    return manifest
 
-    added_items.add(component_name)
 
-    # Copy scaffolding first
-    if "base_ui_scaffold" not in added_items:
-        _copy_base_ui_scaffolding(app_root_dir)
-        added_items.add("base_ui_scaffold")
+def _base_ui_destination(file: str, app_root_dir: pathlib.Path) -> pathlib.Path:
+    """Where a base UI file goes in the project, `components/base/button.py`
+    of the library becomes `components/ui/base/button.py`."""
+    relative = pathlib.PurePosixPath(file).relative_to(BASE_UI_SOURCE_DIR)
+    if relative.parts[0] == "components":
+        relative = relative.relative_to("components")
+    return app_root_dir / "components" / "ui" / relative
 
-    dest_file = app_root_dir / "components" / "ui" / "base" / f"{component_name}.py"
-    shutil.copy(source_file, dest_file)
-    typer.secho(
-        f"  - Added component '{component_name}' to {dest_file.relative_to(pathlib.Path.cwd())}",
-        fg=typer.colors.CYAN,
+
+def _wrapped_react_destination(file: str, app_root_dir: pathlib.Path) -> pathlib.Path:
+    return (
+        app_root_dir / "components" / "wrapped_react" / pathlib.PurePosixPath(file).name
     )
 
-    dependencies = _find_base_ui_component_imports(source_file)
-    for dep_name in dependencies:
-        _add_base_ui_component(dep_name, added_items, app_root_dir)
+
+def _project_path(path: pathlib.Path) -> str:
+    """`path` relative to the project root, which is how the lock file names it."""
+    return path.relative_to(pathlib.Path.cwd()).as_posix()
+
+
+def _local_hash(path: pathlib.Path) -> str | None:
+    return file_hash(path) if path.is_file() else None
+
+
+def _load_lock() -> LockFile:
+    return LockFile(pathlib.Path.cwd() / LOCK_FILE_NAME)
+
+
+def _copy_file(copy: tuple):
+    source, dest = copy
+    dest.write_bytes(source.read_bytes())
+
+
+def _copy_files(copies: list[tuple], app_root_dir: pathlib.Path):
+    """Copies `(library file, dest)` pairs in parallel, creating the packages
+    they go in."""
+    components_dir = app_root_dir / "components"
+    for package in {dest.parent for _, dest in copies}:
+        package.mkdir(parents=True, exist_ok=True)
+        for directory in [package, *package.parents]:
+            if directory == components_dir.parent:
+                break
+            (directory / "__init__.py").touch()
+
+    if copies:
+        with ThreadPoolExecutor(max_workers=min(len(copies), COPY_WORKERS)) as pool:
+            list(pool.map(_copy_file, copies))
+
+
+def _add_base_ui_components(
+    component_names: list[str],
+    manifest: dict,
+    app_root_dir: pathlib.Path,
+    lock: LockFile,
+    force: bool = False,
+) -> list[str]:
+    """Adds base_ui components, the components they use and their support files.
+
+    The files of every closure are merged first, so shared files are only
+    looked at once, then copied in parallel. Like `buridan sync`, files
+    changed locally are kept and their diff is shown, unless `force` is
+    given. Everything installed is recorded in `lock`. Returns the names
+    not found.
+    """
+    missing = []
+    components = set()
+    files: dict[str, str] = {}
+    for name in component_names:
+        entry = manifest["components"].get(name)
+        if entry is None:
+            missing.append(name)
+            continue
+        lock.components.add(name)
+        components.update((name, *entry["dependencies"]))
+        files.update(entry["files"])
+
+    copies, kept, up_to_date = _plan_copies(
+        _statuses(files, _base_ui_destination, app_root_dir, lock), lock, force
+    )
+    _show_kept(kept)
+    _copy_files(copies, app_root_dir)
+
+    for name in missing:
+        typer.secho(
+            f"Component '{name}' not found in base_ui components.",
+            fg=typer.colors.RED,
+        )
+    if components:
+        summary = (
+            f"  - {len(components)} components in {(app_root_dir / 'components' / 'ui').relative_to(pathlib.Path.cwd())}: "
+            f"{len(copies)} files copied, {up_to_date} already up to date"
+        )
+        if kept:
+            summary += (
+                f", {len(kept)} with local changes kept (use --force to overwrite)"
+            )
+        typer.secho(f"{summary}.", fg=typer.colors.CYAN)
+    return missing
 
 
 @add_app.command("component")
-def add_component(component: str):
+def add_component(
+    components: list[str] | None = typer.Argument(
+        None, help="Names of the components to add."
+    ),
+    add_all: bool = typer.Option(False, "--all", help="Add every component."),
+    force: bool = typer.Option(
+        False, "--force", help="Also overwrite files with local changes."
+    ),
+):
     """
-    Add a component and its dependencies to your Reflex project.
+    Add components and their dependencies to your Reflex project.
     """
     _check_reflex_project()
     app_name = _get_app_name()
     app_root_dir = pathlib.Path.cwd() / app_name
 
-    _update_repo()
-    typer.secho(f"Adding component: '{component}'...", fg=typer.colors.GREEN)
-    added_items = set()
-    _add_base_ui_component(component, added_items, app_root_dir)
-    typer.secho("Done.", fg=typer.colors.GREEN)
-
+    if not components and not add_all:
+        typer.secho(
+            "Error: Name the components to add, or pass --all.", fg=typer.colors.RED
+        )
+        raise typer.Exit(1)
 
-def _find_util_imports(file_path: pathlib.Path) -> list[str]:
-    """Parses a Python file and returns a list of util dependencies."""
-    if not file_path.exists():
-        return []
-    content = file_path.read_text()
-    tree = ast.parse(content)
-    dependencies = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ImportFrom):
-            if node.module and node.module.startswith("src.utils"):
-                util_name = node.module.split(".")[2]
-                dependencies.append(util_name)
-    return list(set(dependencies))
+    _select_library()
+    manifest = _load_manifest()
+    names = (
+        sorted(manifest["components"]) if add_all else list(dict.fromkeys(components))
+    )
+    if add_all:
+        typer.secho("Adding all components...", fg=typer.colors.GREEN)
+    else:
+        typer.secho(f"Adding components: {', '.join(names)}...", fg=typer.colors.GREEN)
+    lock = _load_lock()
+    missing = _add_base_ui_components(names, manifest, app_root_dir, lock, force)
+    lock.write()
+    if missing:
+        raise typer.Exit(1)
+    typer.secho("Done.", fg=typer.colors.GREEN)
 
 
 def _add_wrapped_react(
-    component_name: str, added_items: set, app_root_dir: pathlib.Path
+    component_name: str,
+    manifest: dict,
+    app_root_dir: pathlib.Path,
+    lock: LockFile,
+    force: bool = False,
 ):
-    """Adds a single wrapped react component and its utility dependencies."""
-    if component_name in added_items:
-        return
-    added_items.add(component_name)
-
-    source_file = WRAPPED_COMPONENTS_DIR / f"{component_name}.py"
-    if not source_file.is_file():
-        source_file = WRAPPED_COMPONENTS_DIR / component_name / f"{component_name}.py"
+    """Adds a single wrapped react component and records it in `lock`.
 
-    if not source_file.exists():
+    A file changed locally is kept and its diff is shown, unless `force`
+    is given.
+    """
+    entry = manifest["wrapped_react"].get(component_name)
+    if entry is None:
         typer.secho(
             f"Wrapped React component '{component_name}' not found in repository.",
             fg=typer.colors.RED,
         )
         return
 
-    dest_dir = app_root_dir / "components" / "wrapped_react"
-    dest_dir.mkdir(parents=True, exist_ok=True)
-    (dest_dir / "__init__.py").touch()
-    (dest_dir.parent / "__init__.py").touch()
-
-    dest_file = dest_dir / f"{component_name}.py"
-    shutil.copy(source_file, dest_file)
-    typer.secho(
-        f"  - Added wrapped react component '{component_name}' to {dest_file.relative_to(pathlib.Path.cwd())}",
-        fg=typer.colors.CYAN,
+    copies, kept, _ = _plan_copies(
+        _statuses(entry["files"], _wrapped_react_destination, app_root_dir, lock),
+        lock,
+        force,
     )
-
-    # Wrapped components might have util dependencies from the old structure
-    dependencies = _find_util_imports(dest_file)
-    if dependencies:
-        # This part needs to be thought out. For now, let's assume wrapped components are self-contained
-        # or their utils are handled differently. The user request is about base_ui components.
+    _show_kept(kept)
+    _copy_files(copies, app_root_dir)
+    lock.wrapped_react.add(component_name)
+    for _, dest_file in copies:
         typer.secho(
-            f"  - Note: Wrapped component might have legacy util dependencies: {dependencies}. Please verify.",
-            fg=typer.colors.YELLOW,
+            f"  - Added wrapped react component '{component_name}' to {dest_file.relative_to(pathlib.Path.cwd())}",
+            fg=typer.colors.CYAN,
         )
 
 
 @add_app.command("wrapped-react")
-def add_wrapped_react(component: str):
+def add_wrapped_react(
+    component: str,
+    force: bool = typer.Option(
+        False, "--force", help="Also overwrite files with local changes."
+    ),
+):
     """
     Add a wrapped React component and its dependencies to your Reflex project.
     """
@@ -239,62 +433,27 @@ def add_wrapped_react(component: str):
     app_name = _get_app_name()
     app_root_dir = pathlib.Path.cwd() / app_name
 
-    _update_repo()
+    _select_library()
+    manifest = _load_manifest()
     typer.secho(
         f"Adding wrapped React component: '{component}'...", fg=typer.colors.GREEN
     )
-    added_items = set()
-    _add_wrapped_react(component, added_items, app_root_dir)
+    lock = _load_lock()
+    _add_wrapped_react(component, manifest, app_root_dir, lock, force)
+    lock.write()
     typer.secho("Done.", fg=typer.colors.GREEN)
 
 
-def _extract_theme_css(theme_name: str) -> str:
-    """Extracts the CSS for a given theme and its dark variant from wrapper.css."""
-    if not THEMES_CSS_FILE.exists():
-        typer.secho(
-            f"Error: Theme CSS file not found at {THEMES_CSS_FILE}.",
-            fg=typer.colors.RED,
-        )
-        raise typer.Exit(1)
-
-    content = THEMES_CSS_FILE.read_text()
-    extracted_css = []
-
-    # Regex to find the light theme block
-    light_theme_pattern = re.compile(
-        rf"(\.(?:theme-{re.escape(theme_name)}))\s*{{([^}}]*)}}", re.DOTALL
-    )
-    # Regex to find the dark theme block
-    dark_theme_pattern = re.compile(
-        rf"(\.(?:theme-{re.escape(theme_name)}-dark))\s*{{([^}}]*)}}", re.DOTALL
-    )
-
-    light_match = light_theme_pattern.search(content)
-    if light_match:
-        extracted_css.append(f"{light_match.group(1)} {{{light_match.group(2)}}}")
-    else:
-        typer.secho(
-            f"Warning: Light theme '.theme-{theme_name}' not found in wrapper.css.",
-            fg=typer.colors.YELLOW,
-        )
-
-    dark_match = dark_theme_pattern.search(content)
-    if dark_match:
-        extracted_css.append(f"{dark_match.group(1)} {{{dark_match.group(2)}}}")
-    else:
-        typer.secho(
-            f"Warning: Dark theme '.theme-{theme_name}-dark' not found in wrapper.css.",
-            fg=typer.colors.YELLOW,
-        )
-
-    if not extracted_css:
+def _theme_css(theme_name: str, manifest: dict) -> str:
+    """The CSS of a theme and its dark variant."""
+    theme = manifest["themes"].get(theme_name)
+    if theme is None:
         typer.secho(
             f"Error: No CSS found for theme '{theme_name}' or its dark variant.",
             fg=typer.colors.RED,
         )
         raise typer.Exit(1)
-
-    return "\n\n".join(extracted_css)
+    return theme["css"]
 
 
 @add_app.command("theme")
@@ -305,10 +464,11 @@ def add_theme(theme_name: str):
     _check_reflex_project()
     project_root_dir = pathlib.Path.cwd()
 
-    _update_repo()
+    _select_library()
+    manifest = _load_manifest()
     typer.secho(f"Adding theme: '{theme_name}'...", fg=typer.colors.GREEN)
 
-    theme_css_content = _extract_theme_css(theme_name)
+    theme_css_content = _theme_css(theme_name, manifest)
 
     dest_css_dir = project_root_dir / "assets" / "css"
     dest_css_dir.mkdir(parents=True, exist_ok=True)
@@ -322,6 +482,176 @@ def add_theme(theme_name: str):
     typer.secho("Done.", fg=typer.colors.GREEN)
 
 
+STATUS_COLORS = {
+    OUTDATED: typer.colors.YELLOW,
+    MODIFIED: typer.colors.MAGENTA,
+    MISSING: typer.colors.RED,
+}
+
+
+def _file_statuses(
+    lock: LockFile, manifest: dict, app_root_dir: pathlib.Path
+) -> list[tuple[pathlib.Path, str, str, str]]:
+    """`(dest, library file, library hash, status)` of every file the recorded
+    components install, see `cli/lock.py` for the statuses."""
+    files: dict[pathlib.Path, tuple[str, str]] = {}
+    for kind, names, destination in (
+        ("components", lock.components, _base_ui_destination),
+        ("wrapped_react", lock.wrapped_react, _wrapped_react_destination),
+    ):
+        for name in sorted(names):
+            entry = manifest[kind].get(name)
+            if entry is None:
+                typer.secho(
+                    f"Warning: '{name}' is no longer in the component library.",
+                    fg=typer.colors.YELLOW,
+                )
+                continue
+            for file, digest in entry["files"].items():
+                files[destination(file, app_root_dir)] = (file, digest)
+
+    return [
+        (dest, file, digest, _file_status(dest, digest, lock))
+        for dest, (file, digest) in sorted(files.items())
+    ]
+
+
+def _file_status(dest: pathlib.Path, digest: str, lock: LockFile) -> str:
+    return file_status(_local_hash(dest), lock.files.get(_project_path(dest)), digest)
+
+
+def _statuses(
+    files: dict[str, str], destination, app_root_dir: pathlib.Path, lock: LockFile
+) -> list[tuple[pathlib.Path, str, str, str]]:
+    """`(dest, library file, library hash, status)` of manifest `files`."""
+    statuses = []
+    for file, digest in files.items():
+        dest = destination(file, app_root_dir)
+        statuses.append((dest, file, digest, _file_status(dest, digest, lock)))
+    return statuses
+
+
+def _plan_copies(
+    statuses: list[tuple[pathlib.Path, str, str, str]], lock: LockFile, force: bool
+) -> tuple[list[tuple], list[tuple[pathlib.Path, str]], int]:
+    """The `(library file, dest)` pairs to copy, the `(dest, library file)`
+    pairs kept for their local changes and the number of files already up
+    to date. Files that will match the library are recorded in `lock`."""
+    copies = []
+    kept = []
+    up_to_date = 0
+    for dest, file, digest, state in statuses:
+        if state == MODIFIED and not force:
+            kept.append((dest, file))
+            continue
+        if state == UP_TO_DATE:
+            up_to_date += 1
+        else:
+            copies.append((_library_file(file), dest))
+        lock.files[_project_path(dest)] = digest
+    return copies, kept, up_to_date
+
+
+def _show_kept(kept: list[tuple[pathlib.Path, str]]):
+    for dest, file in kept:
+        typer.secho(
+            f"Kept local changes to {_project_path(dest)}:", fg=typer.colors.YELLOW
+        )
+        _show_diff(dest, file)
+
+
+def _show_diff(dest: pathlib.Path, file: str):
+    """Prints how the library version of a file differs from the project's."""
+    diff = difflib.unified_diff(
+        dest.read_text().splitlines(keepends=True),
+        _library_file(file).read_text().splitlines(keepends=True),
+        f"{_project_path(dest)} (local)",
+        f"{file} (library)",
+    )
+    for line in diff:
+        color = None
+        if line.startswith("+"):
+            color = typer.colors.GREEN
+        elif line.startswith("-"):
+            color = typer.colors.RED
+        typer.secho(line.rstrip("\n"), fg=color)
+
+
+def _load_installed() -> tuple[LockFile, dict, pathlib.Path] | None:
+    """The lock, manifest and app directory, or None if nothing was installed."""
+    _check_reflex_project()
+    app_root_dir = pathlib.Path.cwd() / _get_app_name()
+    lock = _load_lock()
+    if not lock.components and not lock.wrapped_react:
+        typer.echo(f"No components are recorded in {LOCK_FILE_NAME}.")
+        return None
+    _select_library()
+    return lock, _load_manifest(), app_root_dir
+
+
+@app.command("status")
+def status(
+    diff: bool = typer.Option(
+        False, "--diff", help="Show how outdated and modified files differ."
+    ),
+):
+    """
+    Show which installed files differ from the component library.
+    """
+    installed = _load_installed()
+    if installed is None:
+        return
+    statuses = _file_statuses(*installed)
+
+    for dest, file, _, state in statuses:
+        if state == UP_TO_DATE:
+            continue
+        typer.secho(f"  {state:<10} {_project_path(dest)}", fg=STATUS_COLORS[state])
+        if diff and state in (OUTDATED, MODIFIED):
+            _show_diff(dest, file)
+
+    counts = Counter(state for *_, state in statuses)
+    typer.echo(
+        ", ".join(
+            f"{counts[state]} {state}"
+            for state in (UP_TO_DATE, OUTDATED, MODIFIED, MISSING)
+            if counts[state]
+        )
+        + "."
+    )
+
+
+@app.command("sync")
+def sync(
+    force: bool = typer.Option(
+        False, "--force", help="Also overwrite files with local changes."
+    ),
+):
+    """
+    Update the installed components to the library version in use.
+
+    Only files that changed in the library are rewritten. Files changed
+    locally are kept and their diff is shown, unless --force is given.
+    """
+    installed = _load_installed()
+    if installed is None:
+        return
+    lock, manifest, app_root_dir = installed
+
+    copies, kept, up_to_date = _plan_copies(
+        _file_statuses(lock, manifest, app_root_dir), lock, force
+    )
+    _show_kept(kept)
+    _copy_files(copies, app_root_dir)
+    lock.write()
+
+    summary = f"  - {len(copies)} files updated, {up_to_date} already up to date"
+    if kept:
+        summary += f", {len(kept)} with local changes kept (use --force to overwrite)"
+    typer.secho(f"{summary}.", fg=typer.colors.CYAN)
+    typer.secho("Done.", fg=typer.colors.GREEN)
+
+
 def _get_app_name() -> str:
     """Parses rxconfig.py to find the app_name."""
     rxconfig_path = pathlib.Path.cwd() / "rxconfig.py"
@@ -366,46 +696,20 @@ def list_all():
     """
     List all available items (components, wrapped React components, themes) in the Buridan UI library.
     """
-    _update_repo()
-    typer.echo("Listing available items from repository...")
-
-    # List Standard Components from base_ui
-    if BASE_UI_BASE_COMPONENTS_DIR.exists():
-        components = [
-            p.stem
-            for p in BASE_UI_BASE_COMPONENTS_DIR.iterdir()
-            if p.suffix == ".py" and not p.name.startswith("__")
-        ]
-        typer.echo("\n--- Base UI Components ---")
-        for component in sorted(components):
-            typer.echo(f"- {component}")
-
-    # List Wrapped React Components
-    if WRAPPED_COMPONENTS_DIR.exists():
-        wrapped_components = []
-        for p in WRAPPED_COMPONENTS_DIR.iterdir():
-            if p.name.startswith("__"):
-                continue
-            if p.is_dir():
-                # It's a directory, so it's a component
-                wrapped_components.append(p.name)
-            elif p.suffix == ".py":
-                # It's a file, so it's a component
-                wrapped_components.append(p.stem)
-
-        typer.echo("\n--- Wrapped React Components ---")
-        for component in sorted(list(set(wrapped_components))):
-            typer.echo(f"- {component}")
-
-    # List Themes
-    themes = set()
-    if THEMES_CSS_FILE.exists():
-        content = THEMES_CSS_FILE.read_text()
-        theme_pattern = re.compile(r"\.theme-([a-zA-Z0-9-]+)(?:-dark)?\s*\{")
-        for match in theme_pattern.finditer(content):
-            themes.add(match.group(1))
+    _select_library()
+    manifest = _load_manifest()
+    typer.echo("Listing available items from the component library...")
+
+    typer.echo("\n--- Base UI Components ---")
+    for component in sorted(manifest["components"]):
+        typer.echo(f"- {component}")
+
+    typer.echo("\n--- Wrapped React Components ---")
+    for component in sorted(manifest["wrapped_react"]):
+        typer.echo(f"- {component}")
+
     typer.echo("\n--- Themes ---")
-    for theme in sorted(list(themes)):
+    for theme in sorted(manifest["themes"]):
         typer.echo(f"- {theme}")
 
 
@@ -0,0 +1,237 @@
+"""Builds the component manifest the CLI reads, see `cli/main.py`.
+
+Run `python -m cli.manifest` from the repository root after changing the
+component library. The pre-commit hook does this for every commit that
+touches it.
+"""
+
+import ast
+import json
+import hashlib
+import pathlib
+import re
+
+MANIFEST_VERSION = 1
+
+LIBRARY_DIR = pathlib.Path("src") / "docs" / "library"
+BASE_UI_DIR = LIBRARY_DIR / "base_ui"
+BASE_UI_BASE_COMPONENTS_DIR = BASE_UI_DIR / "components" / "base"
+WRAPPED_COMPONENTS_DIR = LIBRARY_DIR / "wrapped_components"
+THEMES_CSS_FILE = pathlib.Path("assets") / "css" / "wrapper.css"
+MANIFEST_FILE = LIBRARY_DIR / "manifest.json"
+
+_THEME_PATTERN = re.compile(
+    r"(\.theme-([a-zA-Z0-9-]+?)(-dark)?)\s*\{([^}]*)\}", re.DOTALL
+)
+
+
+def file_hash(path: pathlib.Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _import_targets(path: pathlib.Path, node: ast.ImportFrom) -> list[pathlib.Path]:
+    """The files a relative import in `path` refers to, like `from ..utils import x`."""
+    package = path.parent
+    for _ in range(node.level - 1):
+        package = package.parent
+    if node.module:
+        modules = [package.joinpath(*node.module.split("."))]
+    else:
+        modules = [package / alias.name for alias in node.names]
+
+    targets = []
+    for module in modules:
+        for candidate in (module.with_suffix(".py"), module / "__init__.py"):
+            if candidate.is_file():
+                targets.append(candidate)
+                break
+    return targets
+
+
+def _module_closure(entry: pathlib.Path) -> list[pathlib.Path]:
+    """`entry` and every file it imports relatively, directly or not."""
+    seen = {entry}
+    pending = [entry]
+    while pending:
+        path = pending.pop()
+        for node in ast.walk(ast.parse(path.read_text())):
+            if not isinstance(node, ast.ImportFrom) or node.level == 0:
+                continue
+            for target in _import_targets(path, node):
+                if target not in seen:
+                    seen.add(target)
+                    pending.append(target)
+    return sorted(seen)
+
+
+def _string_constants(path: pathlib.Path) -> dict[str, str]:
+    """Module level string constants of `path`, including imported ones."""
+    constants = {}
+    for node in ast.parse(path.read_text()).body:
+        if isinstance(node, ast.ImportFrom) and node.level:
+            for target in _import_targets(path, node):
+                imported = _string_constants(target)
+                for alias in node.names:
+                    if alias.name in imported:
+                        constants[alias.asname or alias.name] = imported[alias.name]
+        elif (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+        ):
+            value = _string_value(node.value, constants)
+            if value is not None:
+                constants[node.targets[0].id] = value
+    return constants
+
+
+def _string_value(node: ast.expr, constants: dict[str, str]) -> str | None:
+    """Evaluates a string literal or an f-string over known constants."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.Name):
+        return constants.get(node.id)
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.FormattedValue):
+                value = value.value
+            part = _string_value(value, constants)
+            if part is None:
+                return None
+            parts.append(part)
+        return "".join(parts)
+    return None
+
+
+def _npm_package(spec: str) -> tuple[str, str]:
+    """Splits an import path into package and version, `@scope/pkg/sub@1.0` is
+    `("@scope/pkg", "1.0")`."""
+    scope = "@" if spec.startswith("@") else ""
+    path, _, version = spec.removeprefix(scope).partition("@")
+    parts = path.split("/")
+    return scope + "/".join(parts[: 2 if scope else 1]), version
+
+
+def _lib_dependencies(files: list[pathlib.Path]) -> list[str]:
+    """The npm packages the components in `files` load, pinned where a version
+    is given."""
+    versions: dict[str, str] = {}
+    for path in files:
+        constants = _string_constants(path)
+        for node in ast.walk(ast.parse(path.read_text())):
+            if not isinstance(node, ast.ClassDef):
+                continue
+            for statement in node.body:
+                if isinstance(statement, ast.Assign) and len(statement.targets) == 1:
+                    target, value = statement.targets[0], statement.value
+                elif isinstance(statement, ast.AnnAssign) and statement.value:
+                    target, value = statement.target, statement.value
+                else:
+                    continue
+                if not isinstance(target, ast.Name):
+                    continue
+                if target.id == "library":
+                    specs = [_string_value(value, constants)]
+                elif target.id == "lib_dependencies" and isinstance(value, ast.List):
+                    specs = [_string_value(item, constants) for item in value.elts]
+                else:
+                    continue
+                for spec in filter(None, specs):
+                    package, version = _npm_package(spec)
+                    versions[package] = versions.get(package) or version
+    return [
+        f"{package}@{version}" if version else package
+        for package, version in sorted(versions.items())
+    ]
+
+
+def _entry(root: pathlib.Path, files: list[pathlib.Path], **fields) -> dict:
+    return {
+        **fields,
+        "files": {path.relative_to(root).as_posix(): file_hash(path) for path in files},
+        "lib_dependencies": _lib_dependencies(files),
+    }
+
+
+def _base_ui_components(root: pathlib.Path) -> dict:
+    components_dir = root / BASE_UI_BASE_COMPONENTS_DIR
+    components = {}
+    for path in sorted(components_dir.glob("*.py")):
+        if path.name.startswith("__"):
+            continue
+        files = _module_closure(path)
+        components[path.stem] = _entry(
+            root,
+            files,
+            # Other components this one needs, those are added along with it.
+            dependencies=sorted(
+                file.stem
+                for file in files
+                if file.parent == components_dir and file != path
+            ),
+        )
+    return components
+
+
+def _wrapped_components(root: pathlib.Path) -> dict:
+    components = {}
+    for path in sorted((root / WRAPPED_COMPONENTS_DIR).iterdir()):
+        if path.name.startswith("__"):
+            continue
+        source = path / f"{path.name}.py" if path.is_dir() else path
+        if source.suffix != ".py" or not source.is_file():
+            continue
+        components[source.stem] = _entry(root, [source], dependencies=[])
+    return components
+
+
+def _themes(root: pathlib.Path) -> dict:
+    """The light and dark CSS rules of every theme in `wrapper.css`."""
+    variants: dict[str, dict[str, str]] = {}
+    content = (root / THEMES_CSS_FILE).read_text()
+    for match in _THEME_PATTERN.finditer(content):
+        selector, name, dark, body = match.groups()
+        variants.setdefault(name, {})["dark" if dark else "light"] = (
+            f"{selector} {{{body}}}"
+        )
+
+    themes = {}
+    for name, rules in sorted(variants.items()):
+        for variant in ("light", "dark"):
+            if variant not in rules:
+                print(f"Warning: Theme '{name}' has no {variant} variant")
+        themes[name] = {
+            "css": "\n\n".join(
+                rules[variant] for variant in ("light", "dark") if variant in rules
+            )
+        }
+    return themes
+
+
+def build_manifest(root: pathlib.Path) -> dict:
+    """Indexes the component library of the repository at `root`.
+
+    Every base UI component lists the files it needs (itself and everything
+    it imports, directly or not) with their sha256, the components among
+    those and the npm packages they load. Wrapped React components list the
+    same for their single module, and themes hold their extracted CSS.
+    """
+    return {
+        "version": MANIFEST_VERSION,
+        "components": _base_ui_components(root),
+        "wrapped_react": _wrapped_components(root),
+        "themes": _themes(root),
+    }
+
+
+def write_manifest(root: pathlib.Path) -> pathlib.Path:
+    path = root / MANIFEST_FILE
+    content = json.dumps(build_manifest(root), indent=2, sort_keys=True) + "\n"
+    if not path.exists() or path.read_text() != content:
+        path.write_text(content)
+    return path
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_manifest(pathlib.Path.cwd())}")
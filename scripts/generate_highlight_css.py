@@ -0,0 +1,27 @@
+"""
+Script to regenerate the stylesheet of build-time highlighted code blocks:
+
+    python -m scripts.generate_highlight_css
+"""
+
+import pathlib
+import sys
+
+# Add the project root to the Python path to allow imports from 'src'
+ROOT_DIR = pathlib.Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from src.docs.highlight import highlight_css  # noqa: E402
+
+HIGHLIGHT_CSS_PATH = ROOT_DIR / "assets" / "css" / "highlight.css"
+
+
+def main():
+    HIGHLIGHT_CSS_PATH.write_text(highlight_css())
+    print(
+        f"Highlight stylesheet written to: {HIGHLIGHT_CSS_PATH.relative_to(ROOT_DIR)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,5 @@
 import re
-import inspect
 import pathlib
-import importlib
 import sys
 import ast
 import shutil
@@ -10,42 +8,32 @@ import shutil
 ROOT_DIR = pathlib.Path(__file__).parent.parent
 sys.path.append(str(ROOT_DIR))
 
+from src.docs.constants import DOC_DIRECTIVE_PATTERN, DOCS_CACHE_DIR  # noqa: E402
+from src.docs.corpus import DocCorpus  # noqa: E402
+from src.docs.manifest import RouteManifest  # noqa: E402
+from src.docs.registry import ComponentRegistry  # noqa: E402
+from src.docs.source_index import source_index  # noqa: E402
+
 # --- PATHS ---
 DOCS_SOURCE_DIR = ROOT_DIR / "docs"
 MARKDOWN_OUTPUT_DIR = ROOT_DIR / "assets" / "docs"  # Updated output directory
 COMPONENTS_LIBRARY_DIR = ROOT_DIR / "src" / "docs" / "library"
 
 
-def dynamic_load_components(directory: pathlib.Path) -> dict:
+def dynamic_load_components(directory: pathlib.Path) -> ComponentRegistry:
     """
-    Dynamically loads component functions and classes from a given directory
-    and its subdirectories.
+    Statically indexes the component functions and classes of a given directory
+    and its subdirectories. Modules are only imported once a name is looked up.
     """
-    registry = {}
-    for py_file in directory.rglob("*.py"):
-        if py_file.name.startswith("__"):
-            continue
-
-        relative_py_file = py_file.relative_to(ROOT_DIR)
-        module_path = ".".join(relative_py_file.with_suffix("").parts)
-
-        try:
-            module = importlib.import_module(module_path)
-            for name, obj in inspect.getmembers(module):
-                if (
-                    inspect.isfunction(obj) or inspect.isclass(obj)
-                ) and obj.__module__ == module.__name__:
-                    registry[name.lower()] = obj
-        except Exception as e:
-            print(
-                f"Warning: Could not import from module {module_path}. Error: {e}",
-                file=sys.stderr,
-            )
+    registry = ComponentRegistry(
+        ROOT_DIR, index_path=ROOT_DIR / DOCS_CACHE_DIR / "registry.json"
+    )
+    registry.scan(directory.relative_to(ROOT_DIR))
     return registry
 
 
 def get_source_code(
-    command: str, argument: str | None, registry: dict
+    command: str, argument: str | None, registry: ComponentRegistry
 ) -> tuple[str, str] | None:
     """
     Retrieves the source code for a component based on the parsed command and argument.
@@ -78,17 +66,18 @@ def get_source_code(
     elif arg_lower is None and command_lower in registry:
         func_name = command_lower
 
-    if not func_name or func_name not in registry:
+    location = registry.locate(func_name) if func_name else None
+    if location is None:
         return None
 
-    func_obj = registry[func_name]
-
+    _, qualname, source_file = location
     try:
         if command_lower == "full_source_page_of_component":
-            source_file = inspect.getfile(func_obj)
-            code = pathlib.Path(source_file).read_text()
+            code = source_index.file(source_file)
         else:
-            code = inspect.getsource(func_obj)
+            code = source_index.definition(source_file, qualname)
+            if code is None:
+                return None
         return code, language
     except Exception as e:
         print(
@@ -99,11 +88,11 @@ def get_source_code(
     return None
 
 
-def convert_to_pure_markdown(content: str, registry: dict) -> str:
+def convert_to_pure_markdown(content: str, registry: ComponentRegistry) -> str:
     """
-    Replaces custom component delimiters in markdown content with formatted code blocks.
+    Replaces custom component delimiters in markdown content (without its
+    frontmatter) with formatted code blocks.
     """
-    delimiter_pattern = r"--([\w_]+)(?:\((.*)\))?--"
 
     def replacer(match):
         command = match.group(1)
@@ -123,12 +112,11 @@ def convert_to_pure_markdown(content: str, registry: dict) -> str:
                 component_name, cli_command = args
                 component_name_lower = component_name.lower()
 
-                if component_name_lower not in registry:
+                location = registry.locate(component_name_lower)
+                if location is None:
                     return f"Error: Component '{component_name}' not found in registry."
 
-                func = registry[component_name_lower]
-                source_file = inspect.getfile(func)
-                source_code = pathlib.Path(source_file).read_text()
+                source_code = source_index.file(location[2])
 
                 cli_section = f"### CLI\n\n```bash\n{cli_command}\n```"
                 manual_section = (
@@ -149,12 +137,7 @@ def convert_to_pure_markdown(content: str, registry: dict) -> str:
             return f"\n```{language}\n{code.strip()}\n```\n"
         return ""
 
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) > 2:
-            content = parts[2]
-
-    return re.sub(delimiter_pattern, replacer, content)
+    return re.sub(DOC_DIRECTIVE_PATTERN, replacer, content)
 
 
 def main():
@@ -176,7 +159,7 @@ def main():
     # Load components
     print(f"Loading components from: {COMPONENTS_LIBRARY_DIR}")
     component_registry = dynamic_load_components(COMPONENTS_LIBRARY_DIR)
-    print(f"Successfully loaded {len(component_registry)} components.")
+    print(f"Successfully indexed {len(component_registry)} components.")
 
     # Ensure output directory exists
     MARKDOWN_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -185,13 +168,12 @@ def main():
     # Process markdown files
     print(f"Processing markdown files from: {DOCS_SOURCE_DIR}")
     file_count = 0
-    for md_file in DOCS_SOURCE_DIR.rglob("*.md"):
+    for page in DocCorpus(DOCS_SOURCE_DIR).pages:
         file_count += 1
-        original_content = md_file.read_text()
-        pure_md_content = convert_to_pure_markdown(original_content, component_registry)
+        pure_md_content = convert_to_pure_markdown(page.body, component_registry)
 
         # Create new path with hyphens
-        relative_path = md_file.relative_to(DOCS_SOURCE_DIR)
+        relative_path = page.path.relative_to(DOCS_SOURCE_DIR)
         hyphenated_parts = [part.replace("_", "-") for part in relative_path.parts]
         hyphenated_relative_path = pathlib.Path(*hyphenated_parts)
         output_path = MARKDOWN_OUTPUT_DIR / hyphenated_relative_path
@@ -199,10 +181,16 @@ def main():
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_text(pure_md_content)
 
-        print(f"Processed: {md_file.relative_to(ROOT_DIR)}. Status: OK")
+        print(f"Processed: {page.path.relative_to(ROOT_DIR)}. Status: OK")
 
     print(f"\nMarkdown generation complete. Processed {file_count} files.")
 
+    # Persist the route manifest, so the app starts without scanning the docs
+    manifest_path = ROOT_DIR / DOCS_CACHE_DIR / "routes.json"
+    # Paths are kept relative to the project root, like the app resolves them.
+    RouteManifest(DOCS_SOURCE_DIR.relative_to(ROOT_DIR), manifest_path).rebuild()
+    print(f"Route manifest written to: {manifest_path.relative_to(ROOT_DIR)}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,94 @@
+"""
+Script to compare the peak memory of exporting the docs into an app when
+the pages are built as a list first versus streamed page by page.
+
+Both modes run the real `export()` into an `rx.App`, only the page source
+differs. Each mode runs in a fresh interpreter so their peak RSS values
+don't mix:
+
+    python -m scripts.memory_report
+"""
+
+import gc
+import os
+import resource
+import subprocess
+import sys
+import pathlib
+
+# Add the project root to the Python path to allow imports from 'src'
+ROOT_DIR = pathlib.Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+MODES = {
+    "list": "export() over generate_docs_library()",
+    "stream": "export() over iter_docs_library()",
+}
+
+
+def peak_rss_mb() -> float:
+    """Returns the peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(mode: str) -> None:
+    """Exports every doc page into an app in the given mode and prints the
+    peak RSS."""
+    import reflex as rx
+
+    import src.export
+    from src.docs.generator import generate_docs_library
+
+    if mode == "list":
+        # What `export()` did before it consumed the stream.
+        src.export.iter_docs_library = lambda: iter(generate_docs_library())
+
+    app = rx.App()
+    gc.collect()
+    baseline = peak_rss_mb()
+
+    src.export.export(app)
+    # Doc pages plus the redirects below `/docs`.
+    pages = sum(1 for route in app._unevaluated_pages if route.startswith("docs/"))
+
+    print(f"{pages} {baseline:.1f} {peak_rss_mb():.1f}")
+
+
+def main():
+    """Runs each mode in a subprocess and prints a comparison table."""
+    print("Measuring peak RSS of the docs build...")
+    results = {}
+    for mode in MODES:
+        completed = subprocess.run(
+            [sys.executable, "-m", "scripts.memory_report", "--measure", mode],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONWARNINGS": "ignore"},
+        )
+        if completed.returncode != 0:
+            print(f"Error measuring '{mode}':\n{completed.stderr}", file=sys.stderr)
+            sys.exit(1)
+        pages, baseline, peak = completed.stdout.strip().splitlines()[-1].split()
+        results[mode] = (int(pages), float(baseline), float(peak))
+
+    print(
+        f"\n{'mode':<36}{'routes':>8}{'imports MB':>14}{'peak MB':>12}{'build MB':>12}"
+    )
+    for mode, label in MODES.items():
+        pages, baseline, peak = results[mode]
+        print(
+            f"{label:<36}{pages:>8}{baseline:>14.1f}{peak:>12.1f}{peak - baseline:>12.1f}"
+        )
+
+    saved = results["list"][2] - results["stream"][2]
+    print(f"\nPeak RSS saved by streaming: {saved:.1f} MB")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--measure":
+        measure(sys.argv[2])
+    else:
+        main()
@@ -53,7 +53,9 @@ def demo_and_code_single_file_wrapper(
                 class_name=preview_class_name,
             ),
             rx.tabs.content(
-                render_codeblock(content=source, copy_button=True, line_num=True),
+                render_codeblock(
+                    content=source, copy_button=True, line_num=True, lazy=True
+                ),
                 value="source-code",
                 class_name="mt-6",
             ),
@@ -88,7 +90,9 @@ def cli_and_manual_installation_wrapper(cli_command: str, source: str) -> rx.Com
             class_name="mt-6",
         ),
         rx.tabs.content(
-            render_codeblock(content=source, copy_button=True, line_num=True),
+            render_codeblock(
+                content=source, copy_button=True, line_num=True, lazy=True
+            ),
             value="manual",
             class_name="mt-6",
         ),
@@ -0,0 +1,117 @@
+import os
+import json
+import hashlib
+
+from pathlib import Path
+from typing import Dict, List
+
+import src.docs.constants as constants
+
+
+# Bump whenever the shape of cached sections changes.
+CACHE_VERSION = 3
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class DocCache:
+    """Content-addressed on-disk cache for parsed doc pages.
+
+    Each markdown file gets one entry holding its resolved sections and TOC.
+    An entry is keyed by the digest of the markdown content plus the digest of
+    every source file its commands were resolved from, so editing either the
+    page or a referenced module in `src/docs/library` invalidates it.
+
+    Pages with a directive that failed to resolve are never cached. A
+    missing component has no source file to key on, so its entry would not
+    notice the component being added later.
+    """
+
+    def __init__(self, cache_dir: Path, enabled: bool = True):
+        self.cache_dir = cache_dir / "docs"
+        self.enabled = enabled
+        self._file_digests: Dict[str, str | None] = {}
+
+    def get(self, md_file: Path, content: str) -> Dict | None:
+        """Returns the cached sections and TOC for a page, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        try:
+            entry = json.loads(self._entry_path(md_file).read_text())
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("version") != CACHE_VERSION:
+            return None
+
+        key = self._key(content, entry.get("dependencies", []))
+        if key is None or key != entry.get("key"):
+            return None
+
+        return entry
+
+    def set(
+        self,
+        md_file: Path,
+        content: str,
+        sections: List[Dict],
+        table_of_content: List[Dict],
+        dependencies: List[str],
+    ) -> None:
+        if not self.enabled:
+            return
+        if any("error" in section for section in sections):
+            return
+
+        key = self._key(content, dependencies)
+        if key is None:
+            return
+
+        entry = {
+            "version": CACHE_VERSION,
+            "key": key,
+            "dependencies": dependencies,
+            "sections": sections,
+            "table_of_content": table_of_content,
+        }
+
+        entry_path = self._entry_path(md_file)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial entry.
+            tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(entry))
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            print(f"Warning: Could not write doc cache entry for {md_file}: {e}")
+
+    def _entry_path(self, md_file: Path) -> Path:
+        name = _digest(str(md_file).encode())[:32]
+        return self.cache_dir / f"{name}.json"
+
+    def _key(self, content: str, dependencies: List[str]) -> str | None:
+        parts = [f"v{CACHE_VERSION}", _digest(content.encode())]
+        for path in dependencies:
+            file_digest = self._file_digest(path)
+            if file_digest is None:
+                return None
+            parts.append(f"{path}:{file_digest}")
+        return _digest("\n".join(parts).encode())
+
+    def _file_digest(self, path: str) -> str | None:
+        # Many pages share the same library modules, so hash each file once.
+        if path not in self._file_digests:
+            try:
+                self._file_digests[path] = _digest(Path(path).read_bytes())
+            except OSError:
+                self._file_digests[path] = None
+        return self._file_digests[path]
+
+
+doc_cache = DocCache(
+    constants.DOCS_CACHE_DIR,
+    enabled=os.environ.get("BURIDAN_DOCS_CACHE", "true") != "false",
+)
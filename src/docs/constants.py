@@ -15,6 +15,10 @@ class DocParserCommands(str, Enum):
     CLI_AND_MANUAL_INSTALLATION = "cli_and_manual_installation"
 
 
+# Matches `--COMMAND--` and `--COMMAND(argument)--` directives in markdown.
+DOC_DIRECTIVE_PATTERN = r"--([\w_]+)(?:\(([^)]+)\))?--"
+
+
 # --- Generated Doc Type ---
 @dataclass
 class DocDataStruct:
@@ -28,3 +32,4 @@ class DocDataStruct:
 # --- Docs Path Constants ---
 DOCS_BASE_DIR = Path("docs")
 DOCS_LIBRARY_ROOT = "src/docs/library"
+DOCS_CACHE_DIR = Path(".buridan_cache")
@@ -0,0 +1,108 @@
+import re
+import functools
+
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import src.docs.constants as constants
+from src.docs.profiler import build_profiler
+from src.utils.frontmatter import FrontmatterError, parse_frontmatter
+
+
+def extract_table_of_content(md_content: str) -> List[Dict]:
+    """Extract headings for TOC from a page's markdown content."""
+    toc_data = []
+    for match in re.finditer(r"^(#{1,2})\s+(.+)$", md_content, re.MULTILINE):
+        level = len(match.group(1))  # Count the # characters (1-2)
+        heading_text = match.group(2).strip()  # Get the heading text
+
+        toc_data.append(
+            {
+                "text": heading_text,
+                "id": heading_text,
+                "level": level,
+            }
+        )
+    return toc_data
+
+
+@dataclass
+class DocPage:
+    """A single markdown file of the docs, read and split exactly once."""
+
+    path: Path
+    section: str  # Folder inside 'docs/' (e.g., 'getting_started')
+    slug: str  # URL slug below 'docs/' (e.g., 'getting-started/introduction')
+    content: str  # Raw file content, frontmatter included
+    frontmatter: Dict
+    body: str
+
+    @property
+    def url(self) -> str:
+        return f"docs/{self.slug}"
+
+    @functools.cached_property
+    def headings(self) -> List[Dict]:
+        """The level 1-2 headings of the body, in TOC format."""
+        return extract_table_of_content(self.body)
+
+    @functools.cached_property
+    def directives(self) -> List[Tuple[str, str | None]]:
+        """The `--COMMAND(arg)--` directives of the body, in order."""
+        return [
+            (match.group(1), match.group(2))
+            for match in re.finditer(constants.DOC_DIRECTIVE_PATTERN, self.body)
+        ]
+
+
+class DocCorpus:
+    """All markdown files under the docs directory.
+
+    Routes, the docs generator and the markdown export all query this one
+    object instead of globbing and parsing the files themselves.
+    """
+
+    def __init__(self, base_dir: Path):
+        self.base_dir = base_dir
+        self.pages = [
+            self._read(md_file) for md_file in sorted(base_dir.glob("**/*.md"))
+        ]
+        self._pages_by_slug = {page.slug: page for page in self.pages}
+
+    def get(self, slug: str) -> DocPage | None:
+        return self._pages_by_slug.get(slug)
+
+    def section(self, section_folder: str) -> List[DocPage]:
+        """Returns the pages inside a folder of the docs directory."""
+        return [page for page in self.pages if page.section == section_folder]
+
+    def _read(self, md_file: Path) -> DocPage:
+        relative_path = md_file.relative_to(self.base_dir)
+        slug = "/".join(
+            [part.replace("_", "-") for part in relative_path.with_suffix("").parts]
+        )
+
+        with build_profiler.stage("read", page=f"docs/{slug}"):
+            content = md_file.read_text(encoding="utf-8")
+        with build_profiler.stage("frontmatter", page=f"docs/{slug}"):
+            try:
+                frontmatter, body = parse_frontmatter(content)
+            except FrontmatterError as e:
+                print(f"Warning: Invalid frontmatter in '{md_file}': {e}")
+                frontmatter, body = {}, content
+
+        return DocPage(
+            path=md_file,
+            section=relative_path.parts[0],
+            slug=slug,
+            content=content,
+            frontmatter=frontmatter,
+            body=body,
+        )
+
+
+@functools.cache
+def load_corpus() -> DocCorpus:
+    """Returns the shared docs corpus, reading the files on first use."""
+    return DocCorpus(constants.DOCS_BASE_DIR)
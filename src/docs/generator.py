@@ -1,86 +1,139 @@
 import os
-import re
+import multiprocessing
 import src.docs.constants as constants
 
 
-from typing import List
+from typing import Dict, Iterator, List, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from src.docs.cache import doc_cache
+from src.docs.corpus import DocPage, load_corpus
 from src.docs.parser import DocParser
-from src.utils.frontmatter import parse_frontmatter
+from src.docs.profiler import build_profiler
 
 
 parser = DocParser(dynamic_load_dirs=[constants.DOCS_LIBRARY_ROOT])
 
 
 def generate_docs_library() -> List[constants.DocDataStruct]:
-    docs = []
+    return list(iter_docs_library())
+
+
+def iter_docs_library() -> Iterator[constants.DocDataStruct]:
+    """Yields the doc pages one at a time, as they are built.
+
+    `export` registers each page as it arrives. Reflex keeps every page's
+    components until it compiles them, so this does not lower the peak
+    memory of an export, see `scripts/memory_report.py`.
+    """
     dev_mode = os.environ.get("BURIDAN_DEV_MODE") == "true"
 
     if not constants.DOCS_BASE_DIR.exists():
         print(f"Warning: Docs base directory not found: {constants.DOCS_BASE_DIR}")
-        return []
-
-    # Create a mapping from URL slug to file path for all markdown files
-    all_md_files = list(constants.DOCS_BASE_DIR.glob("**/*.md"))
-    slug_to_path_map = {}
-    for md_file in all_md_files:
-        relative_path = md_file.relative_to(constants.DOCS_BASE_DIR)
-        slug = "/".join(
-            [part.replace("_", "-") for part in relative_path.with_suffix("").parts]
-        )
-        slug_to_path_map[slug] = md_file
+        return
+
+    corpus = load_corpus()
 
-    md_files_to_process = []
+    pages_to_process = []
     if dev_mode:
         print("--- Development Mode Enabled ---")
         pages_str = os.environ.get("BURIDAN_DEV_PAGES", "")
         if not pages_str:
             print("Warning: BURIDAN_DEV_PAGES is not set. Loading no pages.")
-            return []
+            return
 
         page_slugs = [slug.strip() for slug in pages_str.split(",")]
         print(f"Loading specified pages: {page_slugs}")
         print("Loading specified URLs:")
         for slug in page_slugs:
             print(f"http://localhost:3000/docs/{slug}")
-            if slug in slug_to_path_map:
-                md_files_to_process.append(slug_to_path_map[slug])
+            page = corpus.get(slug)
+            if page:
+                pages_to_process.append(page)
             else:
                 print(f"Warning: Markdown file not found for slug: {slug}")
     else:
-        md_files_to_process = all_md_files
-
-    for md_file_path in md_files_to_process:
-        relative_path = md_file_path.relative_to(constants.DOCS_BASE_DIR)
-        url_path_parts = [part.replace("_", "-") for part in relative_path.parts]
-        url_path = "docs/" + "/".join(url_path_parts).replace(".md", "")
-
-        # Read the markdown content
-        with open(md_file_path, "r") as f:
-            md_content = f.read()
-
-        __, md_content = parse_frontmatter(md_content)
-
-        # Extract headings for TOC from THIS file's content
-        toc_data = []
-        for match in re.finditer(r"^(#{1,2})\s+(.+)$", md_content, re.MULTILINE):
-            level = len(match.group(1))  # Count the # characters (1-2)
-            heading_text = match.group(2).strip()  # Get the heading text
-
-            toc_data.append(
-                {
-                    "text": heading_text,
-                    "id": heading_text,
-                    "level": level,
-                }
-            )
+        pages_to_process = corpus.pages
 
+    # The pure per-page work runs in the worker pool, components are built here
+    for url_path, sections, toc_data in _load_pages(pages_to_process):
         # Create the doc component (no need for inner function)
-        doc = constants.DocDataStruct(
+        with build_profiler.page(url_path), build_profiler.stage("components"):
+            component = parser.render(sections)
+
+        yield constants.DocDataStruct(
             url=url_path,
-            component=parser.parse_and_render(md_content),
+            component=component,
             table_of_content=toc_data,
         )
 
-        docs.append(doc)
 
-    return docs
+def _load_page(page: DocPage) -> Tuple[str, List[Dict], List[Dict]]:
+    """Parses and resolves a single page without building components.
+
+    Everything returned is plain data, so this can run in a worker process.
+    """
+    with build_profiler.page(page.url):
+        # Unchanged pages skip section parsing and source lookup
+        with build_profiler.stage("cache"):
+            cached = doc_cache.get(page.path, page.content)
+        if cached:
+            return page.url, cached["sections"], cached["table_of_content"]
+
+        sections = parser.parse(page.body)
+        with build_profiler.stage("cache"):
+            doc_cache.set(
+                page.path,
+                page.content,
+                sections,
+                page.headings,
+                parser.dependencies(sections),
+            )
+        return page.url, sections, page.headings
+
+
+def _load_page_profiled(page: DocPage) -> Tuple[Tuple, List[Dict]]:
+    """Loads a page in a worker process, returning its timings with the result."""
+    return _load_page(page), build_profiler.drain()
+
+
+def _load_pages(pages: List[DocPage]) -> Iterator[Tuple[str, List[Dict], List[Dict]]]:
+    """Loads pages in order, fanning out over a worker pool when configured.
+
+    BURIDAN_DOCS_WORKERS sets the pool size ("auto" for one per core, default 1)
+    and BURIDAN_DOCS_POOL picks "thread" (default) or "process" workers.
+
+    Serial is the default: only parsing runs here, ~75 ms of a ~0.9 s build
+    of the docs (~5 ms with the doc cache), rendering takes the rest on the
+    main thread. Spawned processes each import reflex again, which costs
+    more than the parsing they take over (4.5 s with 4 workers vs 0.9 s).
+    """
+    workers_str = os.environ.get("BURIDAN_DOCS_WORKERS", "1")
+    if workers_str == "auto":
+        workers = os.cpu_count() or 1
+    elif workers_str.isdigit():
+        workers = int(workers_str)
+    else:
+        print(f"Warning: Invalid BURIDAN_DOCS_WORKERS value: {workers_str}")
+        workers = 1
+    workers = min(workers, len(pages))
+
+    if workers <= 1:
+        yield from map(_load_page, pages)
+        return
+
+    if os.environ.get("BURIDAN_DOCS_POOL", "thread") != "process":
+        executor = ThreadPoolExecutor(max_workers=workers)
+    else:
+        # Spawn fresh interpreters, forking a process that may hold threads is unsafe.
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    # executor.map yields results in submission order, keeping the output stable.
+    with executor:
+        if isinstance(executor, ProcessPoolExecutor) and build_profiler.enabled:
+            for result, events in executor.map(_load_page_profiled, pages):
+                build_profiler.merge(events)
+                yield result
+        else:
+            yield from executor.map(_load_page, pages)
@@ -0,0 +1,82 @@
+import os
+import functools
+
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import get_lexer_by_name
+from pygments.styles import get_style_by_name
+from pygments.token import Token
+from pygments.util import ClassNotFound
+
+
+# Token classes are prefixed so they never collide with tailwind utilities.
+HIGHLIGHT_CLASS = "hl"
+HIGHLIGHT_CLASS_PREFIX = "hl-"
+
+LIGHT_STYLE = "default"
+DARK_STYLE = "one-dark"
+
+
+def highlighting_enabled() -> bool:
+    """Whether code blocks are highlighted at build time.
+
+    BURIDAN_CODE_HIGHLIGHT=client keeps the browser-side highlighter of
+    `rx.code_block`.
+    """
+    return os.environ.get("BURIDAN_CODE_HIGHLIGHT", "build") != "client"
+
+
+@functools.cache
+def _formatter(line_numbers: bool) -> HtmlFormatter:
+    return HtmlFormatter(
+        cssclass=HIGHLIGHT_CLASS,
+        classprefix=HIGHLIGHT_CLASS_PREFIX,
+        linenos="inline" if line_numbers else False,
+        wrapcode=True,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def highlight_code(code: str, language: str, line_numbers: bool = False) -> str:
+    """Tokenizes code into static HTML, styled by `highlight.css`.
+
+    Many pages embed the same library modules, so results are memoized.
+    """
+    try:
+        lexer = get_lexer_by_name(language)
+    except ClassNotFound:
+        lexer = get_lexer_by_name("text")
+    return highlight(code, lexer, _formatter(line_numbers))
+
+
+def highlight_css() -> str:
+    """Returns the stylesheet for highlighted code in light and dark mode.
+
+    Each color mode gets its own scope, so tokens a style leaves unset never
+    inherit the other mode's colors.
+    """
+    scopes = {
+        LIGHT_STYLE: f"html:not(.dark) .{HIGHLIGHT_CLASS}",
+        DARK_STYLE: f".dark .{HIGHLIGHT_CLASS}",
+    }
+
+    rules = [
+        "/* Generated by scripts/generate_highlight_css.py, do not edit. */",
+        f".{HIGHLIGHT_CLASS} {{ background: transparent; }}",
+        f".{HIGHLIGHT_CLASS} pre {{ margin: 0; padding: 1em; overflow-x: auto; "
+        "font-size: 13px; line-height: 1.5; background: transparent; }",
+        f".{HIGHLIGHT_CLASS_PREFIX}lg .{HIGHLIGHT_CLASS} pre {{ font-size: 14px; }}",
+        f".{HIGHLIGHT_CLASS} .linenos {{ display: inline-block; min-width: 2.25em; "
+        "padding-right: 1em; text-align: right; opacity: 0.5; user-select: none; }",
+        # Placeholder of listings fetched on demand, see `src/docs/sources.py`.
+        "[data-source]:empty::before { content: 'Loading source...'; display: block; "
+        "padding: 1em; font-size: 13px; opacity: 0.5; }",
+    ]
+    for style_name, scope in scopes.items():
+        style = get_style_by_name(style_name)
+        base_color = style.style_for_token(Token)["color"]
+        if base_color:
+            rules.append(f"{scope} {{ color: #{base_color} }}")
+        formatter = HtmlFormatter(style=style, classprefix=HIGHLIGHT_CLASS_PREFIX)
+        rules.extend(formatter.get_token_style_defs(scope))
+    return "\n".join(rules) + "\n"
@@ -0,0 +1,133 @@
+import os
+import json
+import functools
+
+from pathlib import Path
+from typing import Dict, List
+
+import src.docs.constants as constants
+
+
+# Bump whenever the shape of the persisted manifest changes.
+MANIFEST_VERSION = 1
+
+
+class RouteManifest:
+    """A persisted index of the doc routes, built from the docs frontmatter.
+
+    The manifest records the title, slug and order of every page, grouped by
+    section folder, together with the mtime and size of every markdown file
+    and the mtime of every docs directory. Loading it takes a single file read
+    plus a `stat` per entry. It is rebuilt from the docs corpus whenever a
+    file was edited, added or removed.
+    """
+
+    def __init__(self, base_dir: Path, manifest_path: Path, enabled: bool = True):
+        self.base_dir = base_dir
+        self.manifest_path = manifest_path
+        self.enabled = enabled
+
+    def load(self) -> Dict[str, List[Dict]]:
+        """Returns the routes of every section, rebuilding a stale manifest."""
+        if self.enabled:
+            manifest = self._read()
+            if manifest and self._is_fresh(manifest):
+                return manifest["sections"]
+
+        return self.rebuild()
+
+    def rebuild(self) -> Dict[str, List[Dict]]:
+        """Builds and persists a fresh manifest, returning its routes."""
+        manifest = self.build()
+        self.write(manifest)
+        return manifest["sections"]
+
+    def build(self) -> Dict:
+        """Builds a fresh manifest from the markdown files of the docs."""
+        from src.docs.corpus import DocCorpus
+
+        corpus = DocCorpus(self.base_dir)
+
+        sections: Dict[str, List[Dict]] = {}
+        for page in corpus.pages:
+            sections.setdefault(page.section, [])
+            if "title" not in page.frontmatter:
+                continue
+
+            # The URL slug of the page, relative to its section folder.
+            relative_path = page.path.relative_to(self.base_dir / page.section)
+            sections[page.section].append(
+                {
+                    "title": page.frontmatter["title"],
+                    "slug": relative_path.with_suffix("").as_posix().replace("_", "-"),
+                    "order": page.frontmatter.get("order", 0),
+                }
+            )
+
+        directories = []
+        if self.base_dir.is_dir():
+            directories = [self.base_dir, *sorted(self.base_dir.glob("**/"))]
+
+        return {
+            "version": MANIFEST_VERSION,
+            "files": {
+                page.path.as_posix(): self._stat(page.path) for page in corpus.pages
+            },
+            "directories": {
+                directory.as_posix(): self._stat(directory)[0]
+                for directory in dict.fromkeys(directories)
+            },
+            "sections": sections,
+        }
+
+    def write(self, manifest: Dict) -> None:
+        if not self.enabled:
+            return
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(manifest))
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            print(f"Warning: Could not write route manifest: {e}")
+
+    def _read(self) -> Dict | None:
+        try:
+            manifest = json.loads(self.manifest_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if manifest.get("version") != MANIFEST_VERSION:
+            return None
+        return manifest
+
+    def _is_fresh(self, manifest: Dict) -> bool:
+        # Edits change a file's mtime, adding or removing a file changes the
+        # mtime of its directory. Neither check needs to read a file.
+        try:
+            for path, stat in manifest["files"].items():
+                if self._stat(Path(path)) != stat:
+                    return False
+            for path, mtime_ns in manifest["directories"].items():
+                if self._stat(Path(path))[0] != mtime_ns:
+                    return False
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def _stat(path: Path) -> List[int]:
+        stat = path.stat()
+        return [stat.st_mtime_ns, stat.st_size]
+
+
+route_manifest = RouteManifest(
+    constants.DOCS_BASE_DIR,
+    constants.DOCS_CACHE_DIR / "routes.json",
+    enabled=os.environ.get("BURIDAN_DOCS_CACHE", "true") != "false",
+)
+
+
+@functools.cache
+def load_route_manifest() -> Dict[str, List[Dict]]:
+    """Returns the routes of every docs section, keyed by section folder."""
+    return route_manifest.load()
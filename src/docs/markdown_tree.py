@@ -0,0 +1,329 @@
+import os
+import functools
+
+from typing import List
+from urllib.parse import urlparse
+
+import reflex as rx
+
+from src.docs.highlight import highlighting_enabled
+from src.docs.style import (
+    HEADING_1_CLASS,
+    HEADING_2_CLASS,
+    LINK_CLASS,
+    LIST_ITEM_CLASS,
+    PARAGRAPH_CLASS,
+    markdown_component_map,
+    render_codeblock,
+    render_codeblock_html,
+    render_heading,
+    render_link,
+    render_list_item,
+    render_paragraph,
+)
+
+try:
+    from markdown_it import MarkdownIt
+    from markdown_it.token import Token
+    from markdown_it.tree import SyntaxTreeNode
+except ImportError:  # pragma: no cover - markdown-it ships with reflex (via rich)
+    MarkdownIt = None
+
+
+RENDER_MODES = ("islands", "build", "client")
+
+# Sizes of the headings the component map leaves to reflex's defaults.
+HEADING_SIZES = {3: "4", 4: "3", 5: "2", 6: "1"}
+
+# Class names the radix components behind the render helpers put on their
+# element, so prerendered markup picks up the same theme styles.
+RADIX_HEADING_CLASS = "rt-Heading"
+RADIX_TEXT_CLASS = "rt-Text"
+RADIX_LINK_CLASS = "rt-Text rt-reset rt-Link rt-underline-auto"
+RADIX_CODE_CLASS = "rt-reset rt-Code rt-variant-soft"
+
+
+def markdown_render_mode() -> str:
+    """How markdown sections reach the page, set with BURIDAN_MARKDOWN_RENDER.
+
+    - `islands` (default): each section is prerendered to static HTML, which
+      React mounts as a single node. Only the directive components between
+      sections (demos, tabs, copy buttons) and the blocks with internal
+      links are component trees.
+    - `build`: sections are parsed at build time into component trees.
+    - `client`: `rx.markdown`, which ships the source and parses it in the
+      browser.
+
+    Prerendered code needs build-time highlighting, so with
+    BURIDAN_CODE_HIGHLIGHT=client `islands` falls back to `build`. Without
+    markdown-it everything is `client`.
+    """
+    if MarkdownIt is None:
+        return "client"
+    mode = os.environ.get("BURIDAN_MARKDOWN_RENDER", "islands")
+    if mode not in RENDER_MODES:
+        mode = "islands"
+    if mode == "islands" and not highlighting_enabled():
+        return "build"
+    return mode
+
+
+@functools.cache
+def _markdown_parser() -> "MarkdownIt":
+    # The GFM subset the docs use, without linkify (an extra dependency).
+    return MarkdownIt("commonmark").enable(["table", "strikethrough"])
+
+
+def render_markdown(source: str, class_name: str = "px-4") -> rx.Component:
+    """Renders a markdown section with the docs' markdown styles.
+
+    In `islands` mode the section becomes static HTML nodes, except for the
+    blocks with internal links, which stay element trees so the links go
+    through the client-side router. In `build` mode it is emitted as an
+    element tree, going through the same helpers `markdown_component_map`
+    uses in the browser. Sections with raw HTML keep `rx.markdown` there,
+    which renders it in place.
+    """
+    mode = markdown_render_mode()
+    if mode == "islands":
+        return _render_islands(_markdown_parser().parse(source), class_name)
+
+    if mode == "build":
+        tokens = _markdown_parser().parse(source)
+        if not any(_has_raw_html(token) for token in tokens):
+            return rx.el.div(
+                *_render_nodes(SyntaxTreeNode(tokens).children),
+                class_name=class_name,
+            )
+
+    return rx.markdown(
+        source, component_map=markdown_component_map, class_name=class_name
+    )
+
+
+def markdown_html(source: str) -> str:
+    """Prerenders a markdown section to the markup its components produce.
+
+    Raw HTML is passed through, like the rehype-raw plugin of `rx.markdown`.
+    """
+    return _render_html(_markdown_parser().parse(source))
+
+
+def _render_html(tokens: List["Token"]) -> str:
+    parser = _markdown_parser()
+    return parser.renderer.render(_style_tokens(tokens), parser.options, {})
+
+
+def _render_islands(tokens: List["Token"], class_name: str) -> rx.Component:
+    """Prerenders the top-level blocks, keeping those with internal links as
+    element trees. A plain anchor would make them reload the whole app."""
+    children = []
+    static = []
+    for block in _blocks(tokens):
+        if any(_has_internal_link(token) for token in block) and not any(
+            _has_raw_html(token) for token in block
+        ):
+            if static:
+                children.append(rx.html(_render_html(static)))
+                static = []
+            children.extend(_render_nodes(SyntaxTreeNode(block).children))
+        else:
+            static.extend(block)
+
+    if not children:
+        return rx.html(_render_html(static), class_name=class_name)
+    if static:
+        children.append(rx.html(_render_html(static)))
+    return rx.el.div(*children, class_name=class_name)
+
+
+def _blocks(tokens: List["Token"]):
+    """Splits a token stream into its top-level blocks."""
+    block = []
+    depth = 0
+    for token in tokens:
+        block.append(token)
+        depth += token.nesting
+        if depth == 0:
+            yield block
+            block = []
+
+
+def _style_tokens(tokens: List["Token"]) -> List["Token"]:
+    """Adds the render helpers' classes to the tokens, and replaces code
+    blocks with their highlighted markup."""
+    styled = []
+    for i, token in enumerate(tokens):
+        kind = token.type
+
+        if kind == "heading_open":
+            level = int(token.tag[1])
+            if level <= 2:
+                heading_class = HEADING_1_CLASS if level == 1 else HEADING_2_CLASS
+                token.attrSet(
+                    "class", f"{RADIX_HEADING_CLASS} rt-r-size-6 {heading_class}"
+                )
+                # The text doubles as the anchor id, see `render_heading`.
+                token.attrSet("id", _inline_text(tokens[i + 1]))
+            else:
+                token.attrSet(
+                    "class", f"{RADIX_HEADING_CLASS} rt-r-size-{HEADING_SIZES[level]}"
+                )
+                token.attrSet("style", "margin-top:0.5em;margin-bottom:0.5em")
+        elif kind == "paragraph_open":
+            token.attrSet("class", f"{RADIX_TEXT_CLASS} {PARAGRAPH_CLASS}")
+        elif kind in ("bullet_list_open", "ordered_list_open"):
+            list_style = "disc" if kind == "bullet_list_open" else "decimal"
+            token.attrSet(
+                "style",
+                f"list-style-type:{list_style};margin-top:1em;"
+                "margin-bottom:1em;margin-left:1.5rem",
+            )
+        elif kind in ("fence", "code_block"):
+            language = (
+                token.info.split(maxsplit=1)[0] if token.info.strip() else "python"
+            )
+            html = render_codeblock_html(token.content.removesuffix("\n"), language)
+            token = Token("html_block", "", 0, content=html)
+        elif kind == "inline":
+            for child in token.children or []:
+                if child.type == "link_open":
+                    child.attrSet("class", f"{RADIX_LINK_CLASS} {LINK_CLASS}")
+                elif child.type == "code_inline":
+                    child.attrSet("class", RADIX_CODE_CLASS)
+
+        styled.append(token)
+
+        # `render_list_item` wraps everything in the item in a text span.
+        if kind == "list_item_open":
+            span = f'<span class="{RADIX_TEXT_CLASS} {LIST_ITEM_CLASS}">'
+            styled.append(Token("html_block", "", 0, content=span))
+        elif kind == "list_item_close":
+            styled.insert(-1, Token("html_block", "", 0, content="</span>"))
+
+    return styled
+
+
+def _inline_text(token: "Token") -> str:
+    return "".join(
+        child.content
+        for child in token.children or []
+        if child.type in ("text", "code_inline")
+    )
+
+
+def _has_internal_link(token) -> bool:
+    """Links to another page of the site, same-page anchors excluded."""
+    if token.type == "link_open":
+        href = str(token.attrGet("href") or "")
+        url = urlparse(href)
+        return not (href.startswith("#") or url.scheme or url.netloc)
+    return any(_has_internal_link(child) for child in token.children or [])
+
+
+def _has_raw_html(token) -> bool:
+    if token.type in ("html_block", "html_inline"):
+        return True
+    return any(_has_raw_html(child) for child in token.children or [])
+
+
+def _render_nodes(nodes) -> List[rx.Component | str]:
+    children = []
+    for node in nodes:
+        rendered = _render_node(node)
+        if isinstance(rendered, list):
+            children.extend(rendered)
+        elif rendered is not None and rendered != "":
+            children.append(rendered)
+    return children
+
+
+def _content(nodes) -> rx.Component | str:
+    """Children as one value, for the helpers that take a single `text`."""
+    children = _render_nodes(nodes)
+    if len(children) == 1:
+        return children[0]
+    return rx.fragment(*children)
+
+
+def _plain_text(node) -> str:
+    if node.type in ("text", "code_inline"):
+        return node.content
+    if node.type in ("softbreak", "hardbreak"):
+        return " "
+    return "".join(_plain_text(child) for child in node.children)
+
+
+def _render_node(node):
+    kind = node.type
+
+    if kind == "inline":
+        return _render_nodes(node.children)
+    if kind == "text":
+        return node.content
+    if kind == "softbreak":
+        return "\n"
+    if kind == "hardbreak":
+        return rx.el.br()
+
+    if kind == "heading":
+        level = int(node.tag[1])
+        if level <= 2:
+            # The text doubles as the anchor id, like in the browser.
+            return render_heading(level, _plain_text(node))
+        return rx.heading(
+            *_render_nodes(node.children),
+            as_=node.tag,
+            size=HEADING_SIZES[level],
+            margin_y="0.5em",
+        )
+    if kind == "paragraph":
+        # Paragraphs of tight lists render their text straight into the item.
+        if node.hidden:
+            return _render_nodes(node.children)
+        return render_paragraph(_content(node.children))
+    if kind == "bullet_list":
+        return rx.list.unordered(*_render_nodes(node.children), margin_y="1em")
+    if kind == "ordered_list":
+        start = node.attrs.get("start")
+        return rx.list.ordered(
+            *_render_nodes(node.children),
+            margin_y="1em",
+            custom_attrs={"start": start} if start is not None else {},
+        )
+    if kind == "list_item":
+        return render_list_item(_content(node.children))
+    if kind in ("fence", "code_block"):
+        language = node.info.split(maxsplit=1)[0] if node.info.strip() else "python"
+        return render_codeblock(node.content.removesuffix("\n"), language)
+    if kind == "code_inline":
+        return rx.code(node.content)
+    if kind == "link":
+        props = {"href": node.attrs["href"]}
+        if "title" in node.attrs:
+            props["title"] = node.attrs["title"]
+        return render_link(_content(node.children), **props)
+    if kind == "image":
+        return rx.el.img(src=node.attrs["src"], alt=_plain_text(node))
+    if kind == "strong":
+        return rx.el.strong(*_render_nodes(node.children))
+    if kind == "em":
+        return rx.el.em(*_render_nodes(node.children))
+    if kind == "s":
+        return rx.el.del_(*_render_nodes(node.children))
+    if kind == "blockquote":
+        return rx.el.blockquote(*_render_nodes(node.children))
+    if kind == "hr":
+        return rx.el.hr()
+
+    if kind in ("table", "thead", "tbody", "tr", "th", "td"):
+        props = {}
+        # Column alignment, e.g. `text-align:center`.
+        if "style" in node.attrs:
+            prop, _, value = node.attrs["style"].partition(":")
+            props["style"] = {prop.strip(): value.strip()}
+        element = getattr(rx.el, kind)
+        return element(*_render_nodes(node.children), **props)
+
+    print(f"Warning: Unsupported markdown element '{kind}', skipping it")
+    return None
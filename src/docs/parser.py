@@ -2,17 +2,32 @@ import re
 import ast
 import inspect
 import pathlib
-import importlib
 import reflex as rx
 
-from typing import Dict, Callable, List
-from src.docs.constants import DocParserCommands
-from src.docs.style import render_parse_error, markdown_component_map
+from typing import Dict, Callable, List, Tuple
+from src.docs.constants import (
+    DOC_DIRECTIVE_PATTERN,
+    DOCS_CACHE_DIR,
+    DocParserCommands,
+)
+from src.docs.profiler import build_profiler
+from src.docs.registry import ComponentRegistry
+from src.docs.source_index import source_index
+from src.docs.highlight import highlighting_enabled
+from src.docs.markdown_tree import render_markdown
+from src.docs.style import (
+    markdown_component_map,
+    render_codeblock,
+    render_parse_error,
+)
 from src.comps.docs.wrapper import (
     demo_and_code_single_file_wrapper,
     cli_and_manual_installation_wrapper,
 )
 
+# Raised by `_find_source` for a library file that cannot be read or parsed.
+SOURCE_ERRORS = (OSError, SyntaxError, UnicodeDecodeError)
+
 
 class DocParser:
     def __init__(
@@ -20,11 +35,28 @@ class DocParser:
         components_registry: Dict[str, Callable] | None = None,
         dynamic_load_dirs: List[str] | None = None,
     ):
-        self.components_registry = components_registry or {}
+        # Library modules are indexed statically and only imported once a page
+        # actually references one of their names.
+        self.components_registry = ComponentRegistry(
+            index_path=DOCS_CACHE_DIR / "registry.json"
+        )
+        if components_registry:
+            self.components_registry.update(components_registry)
         if dynamic_load_dirs:
             for directory in dynamic_load_dirs:
-                self.components_registry.update(self._dynamic_load(directory))
+                self.components_registry.scan(directory)
+
+        # Resolvers do the pure work for a command (argument parsing and source
+        # lookup) and return plain data, so their output can be cached.
+        self.command_resolvers = {
+            DocParserCommands.DEMO_AND_CODE_SINGLE_FILE: self._resolve_demo_and_code_single_file,
+            DocParserCommands.SHOW_CODE_WITH_LANGUAGE: self._resolve_show_code_with_language,
+            DocParserCommands.DEMO_AND_SINGLE_FUNCTION: self._resolve_demo_and_single_function,
+            DocParserCommands.FULL_SOURCE_PAGE_OF_COMPONENT: self._resolve_full_source_page_of_component,
+            DocParserCommands.CLI_AND_MANUAL_INSTALLATION: self._resolve_cli_and_manual_installation,
+        }
 
+        # Handlers turn a resolved command section into a component.
         self.command_handlers = {
             DocParserCommands.DEMO_AND_CODE_SINGLE_FILE: self._handle_demo_and_code_single_file,
             DocParserCommands.SHOW_CODE_WITH_LANGUAGE: self._handle_show_code_with_language,
@@ -34,70 +66,67 @@ class DocParser:
         }
 
     def parse_and_render(self, content: str) -> List[rx.Component]:
-        sections = self._parse_sections(content)
+        return self.render(self.parse(content))
+
+    def parse(self, content: str) -> List[Dict]:
+        """Splits content into sections and resolves the source of every command.
+
+        The result only holds JSON-serializable data, no components.
+        """
+        with build_profiler.stage("sections"):
+            sections = self._parse_sections(content)
+        for section in sections:
+            if section["type"] == "command":
+                with build_profiler.stage(f"directive:{section['command'].lower()}"):
+                    section.update(
+                        self._resolve_command(section["command"], section["argument"])
+                    )
+        return sections
+
+    def render(self, sections: List[Dict]) -> List[rx.Component]:
         components = []
         for section in sections:
             if section["type"] == "content":
-                components.append(
-                    rx.markdown(
-                        section["value"],
-                        component_map=markdown_component_map,
-                        class_name="px-4",
-                    )
-                )
+                components.append(render_markdown(section["value"]))
             elif section["type"] == "command":
-                components.append(
-                    self._handle_command(section["command"], section["argument"])
-                )
+                components.append(self._handle_command(section))
         return components
 
-    def _handle_command(self, command: str, argument: str | None) -> rx.Component:
+    @staticmethod
+    def dependencies(sections: List[Dict]) -> List[str]:
+        """Returns the source files the resolved sections were read from."""
+        return sorted({section["path"] for section in sections if "path" in section})
+
+    def _resolve_command(self, command: str, argument: str | None) -> Dict:
+        resolver = self.command_resolvers.get(command.lower())
+        if resolver:
+            return resolver(argument)
+        return {}
+
+    def _handle_command(self, section: Dict) -> rx.Component:
+        command = section["command"]
+        argument = section["argument"]
         command_lower = command.lower()
+
+        if "error" in section:
+            return render_parse_error(msg=section["error"])
+
         handler = self.command_handlers.get(command_lower)
 
         if handler:
-            return handler(argument)
+            return handler(section)
 
-        if command_lower in self.components_registry and argument is None:
-            component_func = self.components_registry[command_lower]
+        component_func = self.components_registry.get(command_lower)
+        if component_func is not None and argument is None:
             return component_func()
 
         return render_parse_error(msg=f"Unknown component or command: {command}")
 
-    def _dynamic_load(self, directory: str) -> Dict[str, Callable]:
-        """Dynamically loads components from a given directory."""
-        registry = {}
-        root_dir = pathlib.Path(__file__).parent.parent.parent
-        search_path = root_dir / directory
-
-        if not search_path.is_dir():
-            print(f"Warning: Dynamic load directory not found: {directory}")
-            return {}
-
-        for py_file in search_path.rglob("*.py"):
-            if py_file.name.startswith("__"):
-                continue
-
-            # Create module path for importlib
-            relative_py_file = py_file.relative_to(root_dir)
-            module_path = ".".join(relative_py_file.with_suffix("").parts)
-            try:
-                module = importlib.import_module(module_path)
-                for name, obj in inspect.getmembers(module):
-                    if (
-                        inspect.isfunction(obj) or inspect.isclass(obj)
-                    ) and obj.__module__ == module.__name__:
-                        registry[name.lower()] = obj
-            except Exception as e:
-                print(f"Error loading components from module {module_path}: {e}")
-        return registry
-
     def _parse_sections(self, content: str) -> List[Dict]:
-        delimiter_pattern = r"--([\w_]+)(?:\(([^)]+)\))?--"
         sections = []
         current_pos = 0
 
-        for match in re.finditer(delimiter_pattern, content):
+        for match in re.finditer(DOC_DIRECTIVE_PATTERN, content):
             if match.start() > current_pos:
                 text_content = content[current_pos : match.start()].strip()
                 if text_content:
@@ -120,6 +149,10 @@ class DocParser:
     def _create_code_block_markdown(
         self, code: str, language: str = "python"
     ) -> rx.Component:
+        # The source is known here, so skip markdown and highlight it at build time
+        if highlighting_enabled():
+            return rx.el.div(render_codeblock(code, language), class_name="px-4")
+
         md_code = f"```{language}\n{code}```"
 
         return rx.markdown(
@@ -128,151 +161,177 @@ class DocParser:
             class_name="px-4",
         )
 
-    def _handle_cli_and_manual_installation(self, argument: str | None):
+    def _find_source(
+        self, name: str, whole_file: bool = False
+    ) -> Tuple[str, str] | None:
+        """Returns `(file, source)` of a component, or None if it is unknown.
+
+        Indexed components are looked up in the shared source index without
+        importing their module. Components registered as objects fall back
+        to `inspect`.
+        """
+        location = self.components_registry.locate(name)
+        if location:
+            _, qualname, file_path = location
+            if whole_file:
+                return file_path, source_index.file(file_path)
+            source = source_index.definition(file_path, qualname)
+            return (file_path, source) if source is not None else None
+
+        component = self.components_registry.get(name)
+        if component is None:
+            return None
+        file_path = inspect.getfile(component)
+        if whole_file:
+            return file_path, pathlib.Path(file_path).read_text()
+        return file_path, inspect.getsource(component)
+
+    # --- Command resolvers ---
+    def _resolve_cli_and_manual_installation(self, argument: str | None) -> Dict:
         if not argument:
-            return render_parse_error(
-                msg="Missing argument for cli_and_manual_installation"
-            )
+            return {"error": "Missing argument for cli_and_manual_installation"}
 
         try:
             args = ast.literal_eval(argument)
             if not isinstance(args, list) or len(args) != 2:
-                return render_parse_error(
-                    msg='Invalid argument format for CLI_AND_MANUAL_INSTALLATION. Expected ["ComponentName", "cli command"]'
-                )
+                return {
+                    "error": 'Invalid argument format for CLI_AND_MANUAL_INSTALLATION. Expected ["ComponentName", "cli command"]'
+                }
 
             component_name, cli_command = args
             component_name_lower = component_name.lower()
 
-            if component_name_lower not in self.components_registry:
-                return render_parse_error(msg=f"Component not found: {component_name}")
-
-            func = self.components_registry[component_name_lower]
-            file_path = inspect.getfile(func)
-            full_source = pathlib.Path(file_path).read_text()
+            found = self._find_source(component_name_lower, whole_file=True)
+            if found is None:
+                return {"error": f"Component not found: {component_name}"}
 
-            return cli_and_manual_installation_wrapper(cli_command, full_source)
+            file_path, full_source = found
+            return {
+                "name": component_name_lower,
+                "cli_command": cli_command,
+                "path": file_path,
+                "source": full_source,
+            }
 
         except (ValueError, SyntaxError, IndexError) as e:
-            return render_parse_error(
-                msg=f"Error parsing arguments for CLI_AND_MANUAL_INSTALLATION: {e}"
-            )
+            return {
+                "error": f"Error parsing arguments for CLI_AND_MANUAL_INSTALLATION: {e}"
+            }
         except Exception as e:
-            return render_parse_error(msg=f"Error loading source: {e}")
+            return {"error": f"Error loading source: {e}"}
 
-    def _handel_full_source_page_of_component(
-        self, argument: str | None
-    ) -> rx.Component:
+    def _resolve_full_source_page_of_component(self, argument: str | None) -> Dict:
         if not argument:
-            return render_parse_error(
-                msg="Missing argument for full_source_page_of_component"
-            )
+            return {"error": "Missing argument for full_source_page_of_component"}
 
         arg_lower = argument.lower()
-        if arg_lower not in self.components_registry:
-            return render_parse_error(msg=f"Component not found: {argument}")
-
-        func = self.components_registry[arg_lower]
-
         try:
-            file_path = inspect.getfile(func)
-            full_source = pathlib.Path(file_path).read_text()
+            found = self._find_source(arg_lower, whole_file=True)
+        except Exception as e:
+            return {"error": f"Error loading source: {e}"}
 
-            return self._create_code_block_markdown(full_source, "python")
+        if found is None:
+            return {"error": f"Component not found: {argument}"}
 
-        except Exception as e:
-            return render_parse_error(msg=f"Error loading source: {e}")
+        file_path, full_source = found
+        return {"name": arg_lower, "path": file_path, "source": full_source}
 
-    def _handle_show_code_with_language(self, argument: str | None) -> rx.Component:
+    def _resolve_show_code_with_language(self, argument: str | None) -> Dict:
         if not argument:
-            return render_parse_error(
-                msg="Missing arguments for show_code_with_language"
-            )
+            return {"error": "Missing arguments for show_code_with_language"}
 
         try:
             args = ast.literal_eval(argument)
 
             if not isinstance(args, list) or len(args) == 0:
-                return render_parse_error(
-                    msg="Invalid argument format. Expected a list. Example: [function_name, code_block_langauge]"
-                )
-
-            arg_lower = args[0].lower()
-            if arg_lower not in self.components_registry:
-                return render_parse_error(
-                    msg=f"Missing component for show_code_with_language: {args[0]}"
-                )
-
-            return self._create_code_block_markdown(
-                inspect.getsource(self.components_registry[arg_lower]), args[1]
-            )
-
+                return {
+                    "error": "Invalid argument format. Expected a list. Example: [function_name, code_block_langauge]"
+                }
         except (ValueError, SyntaxError):
-            return render_parse_error(
-                msg="Error parsing arguments. Ensure they are in a valid format."
-            )
+            return {
+                "error": "Error parsing arguments. Ensure they are in a valid format."
+            }
 
-    def _handle_demo_and_code_single_file(self, argument: str | None) -> rx.Component:
+        arg_lower = args[0].lower()
+        try:
+            found = self._find_source(arg_lower)
+        except SOURCE_ERRORS as e:
+            return {"error": f"Error loading source: {e}"}
+        if found is None:
+            return {
+                "error": f"Missing component for show_code_with_language: {args[0]}"
+            }
+
+        file_path, source = found
+        return {
+            "name": arg_lower,
+            "language": args[1] if len(args) > 1 else "python",
+            "path": file_path,
+            "source": source,
+        }
+
+    def _resolve_demo_and_code_single_file(self, argument: str | None) -> Dict:
         if not argument:
-            return render_parse_error(
-                msg="Missing arguments for demo_and_code_single_file"
-            )
+            return {"error": "Missing arguments for demo_and_code_single_file"}
 
         arg_lower = argument.lower()
         try:
-            if not isinstance(arg_lower, str):
-                return render_parse_error(
-                    msg="Invalid argument format. Expected a string. Example: function_name"
-                )
-
-            if arg_lower not in self.components_registry:
-                return render_parse_error(
-                    msg=f"Missing component for demo_and_code_single_file: {argument}"
-                )
-
-            component = self.components_registry[arg_lower]
-            module = inspect.getmodule(component)
-            source_code = inspect.getsource(module)
-            component_file_path = inspect.getfile(component)
-            is_chart_demo = "/src/docs/library/charts/" in component_file_path
-
-            return demo_and_code_single_file_wrapper(
-                component(), source_code, is_chart_demo
-            )
-
-        except (ValueError, SyntaxError):
-            return render_parse_error(
-                msg="Error parsing arguments. Ensure they are in a valid format."
-            )
-
-    def _handle_demo_and_single_function(self, argument: str | None) -> rx.Component:
+            found = self._find_source(arg_lower, whole_file=True)
+        except SOURCE_ERRORS as e:
+            return {"error": f"Error loading source: {e}"}
+        if found is None:
+            return {
+                "error": f"Missing component for demo_and_code_single_file: {argument}"
+            }
+
+        file_path, module_source = found
+        return {"name": arg_lower, "path": file_path, "source": module_source}
+
+    def _resolve_demo_and_single_function(self, argument: str | None) -> Dict:
         if not argument:
-            return render_parse_error(
-                msg="Missing arguments for demo_and_single_function"
-            )
+            return {"error": "Missing arguments for demo_and_single_function"}
 
         arg_lower = argument.lower()
         try:
-            if not isinstance(arg_lower, str):
-                return render_parse_error(
-                    msg="Invalid argument format. Expected a string. Example: function_name"
-                )
-
-            if arg_lower not in self.components_registry:
-                return render_parse_error(
-                    msg=f"Missing component for demo_and_single_function: {argument}"
-                )
-
-            component = self.components_registry[arg_lower]
-            source_code = inspect.getsource(component)
-            component_file_path = inspect.getfile(component)
-            is_chart_demo = "/src/docs/library/charts/" in component_file_path
-
-            return demo_and_code_single_file_wrapper(
-                component(), source_code, is_chart_demo
-            )
+            found = self._find_source(arg_lower)
+        except SOURCE_ERRORS as e:
+            return {"error": f"Error loading source: {e}"}
+        if found is None:
+            return {
+                "error": f"Missing component for demo_and_single_function: {argument}"
+            }
+
+        file_path, source = found
+        return {"name": arg_lower, "path": file_path, "source": source}
+
+    # --- Command handlers ---
+    def _handle_cli_and_manual_installation(self, section: Dict) -> rx.Component:
+        return cli_and_manual_installation_wrapper(
+            section["cli_command"], section["source"]
+        )
 
-        except (ValueError, SyntaxError):
-            return render_parse_error(
-                msg="Error parsing arguments. Ensure they are in a valid format."
-            )
+    def _handel_full_source_page_of_component(self, section: Dict) -> rx.Component:
+        return self._create_code_block_markdown(section["source"], "python")
+
+    def _handle_show_code_with_language(self, section: Dict) -> rx.Component:
+        return self._create_code_block_markdown(section["source"], section["language"])
+
+    def _handle_demo_and_code_single_file(self, section: Dict) -> rx.Component:
+        component = self.components_registry.get(section["name"])
+        if component is None:
+            return render_parse_error(msg=f"Error loading component: {section['name']}")
+        is_chart_demo = "/src/docs/library/charts/" in section["path"]
+
+        return demo_and_code_single_file_wrapper(
+            component(), section["source"], is_chart_demo
+        )
+
+    def _handle_demo_and_single_function(self, section: Dict) -> rx.Component:
+        component = self.components_registry.get(section["name"])
+        if component is None:
+            return render_parse_error(msg=f"Error loading component: {section['name']}")
+        is_chart_demo = "/src/docs/library/charts/" in section["path"]
+
+        return demo_and_code_single_file_wrapper(
+            component(), section["source"], is_chart_demo
+        )
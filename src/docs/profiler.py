@@ -0,0 +1,185 @@
+import os
+import json
+import time
+import threading
+import contextlib
+import contextvars
+
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import src.docs.constants as constants
+
+
+# The page the current thread (or worker process) is working on.
+_current_page: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "current_page", default="(build)"
+)
+
+
+class BuildProfiler:
+    """Opt-in timing of the docs build, per page and per stage.
+
+    Stages are `read`, `frontmatter`, `cache`, `sections`, one
+    `directive:<command>` per command type and `components`. Registering a
+    page is lazy, Reflex compiles the pages after `export`, so that time is
+    not part of the report.
+    Every timed stage is kept as an event, so the same data feeds the sorted
+    text report, the JSON dump and the speedscope profile written to
+    `.buridan_cache/profile/`. Worker processes record their own events and
+    hand them back with their results, see `drain`.
+    """
+
+    def __init__(self, output_dir: Path, enabled: bool = False):
+        self.output_dir = output_dir
+        self.enabled = enabled
+        self.events: List[Dict] = []
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def page(self, page: str) -> Iterator[None]:
+        """Attributes the stages timed inside the block to a page."""
+        if not self.enabled:
+            yield
+            return
+        token = _current_page.set(page)
+        try:
+            yield
+        finally:
+            _current_page.reset(token)
+
+    @contextlib.contextmanager
+    def stage(self, name: str, page: str | None = None) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            event = {
+                "page": page or _current_page.get(),
+                "stage": name,
+                "start": start,
+                "end": end,
+                "thread": f"{os.getpid()}:{threading.get_ident()}",
+            }
+            with self._lock:
+                self.events.append(event)
+
+    def drain(self) -> List[Dict]:
+        """Returns and clears the recorded events, for sending them to the parent."""
+        with self._lock:
+            events, self.events = self.events, []
+        return events
+
+    def merge(self, events: List[Dict]) -> None:
+        with self._lock:
+            self.events.extend(events)
+
+    def finish(self, top: int = 15) -> None:
+        """Prints the timing report and writes the JSON and speedscope files."""
+        if not self.enabled or not self.events:
+            return
+
+        pages = self._page_totals()
+        stages: Dict[str, float] = {}
+        for event in self.events:
+            duration = (event["end"] - event["start"]) / 1e6
+            stages[event["stage"]] = stages.get(event["stage"], 0.0) + duration
+
+        print("\n--- Docs build profile ---")
+        print(f"{'stage':<40}{'total ms':>12}")
+        for stage, total in sorted(stages.items(), key=lambda x: -x[1]):
+            print(f"{stage:<40}{total:>12.1f}")
+
+        print("(compiling the pages is left to Reflex and not included)")
+
+        print(f"\nSlowest {min(top, len(pages))} of {len(pages)} pages:")
+        print(f"{'page':<48}{'total ms':>10}  slowest stages")
+        for page, breakdown in list(pages.items())[:top]:
+            slowest = sorted(breakdown.items(), key=lambda x: -x[1])[:3]
+            details = ", ".join(f"{stage} {ms:.1f}" for stage, ms in slowest)
+            print(f"{page:<48}{sum(breakdown.values()):>10.1f}  {details}")
+
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            report_path = self.output_dir / f"build-{stamp}.json"
+            report_path.write_text(
+                json.dumps({"pages": pages, "stages": stages, "events": self.events})
+            )
+            speedscope_path = self.output_dir / f"build-{stamp}.speedscope.json"
+            speedscope_path.write_text(json.dumps(self._speedscope()))
+        except OSError as e:
+            print(f"Warning: Could not write build profile: {e}")
+            return
+
+        print(f"\nProfile written to: {report_path}")
+        print(f"Speedscope profile: {speedscope_path} (open in speedscope.app)")
+
+    def _page_totals(self) -> Dict[str, Dict[str, float]]:
+        """Milliseconds per stage for each page, slowest page first."""
+        pages: Dict[str, Dict[str, float]] = {}
+        for event in self.events:
+            breakdown = pages.setdefault(event["page"], {})
+            duration = (event["end"] - event["start"]) / 1e6
+            breakdown[event["stage"]] = breakdown.get(event["stage"], 0.0) + duration
+        return dict(sorted(pages.items(), key=lambda x: -sum(x[1].values())))
+
+    def _speedscope(self) -> Dict:
+        """Builds an evented speedscope profile with one lane per thread.
+
+        Each stage is nested under a frame for its page.
+        """
+        frames: List[Dict] = []
+        frame_ids: Dict[str, int] = {}
+
+        def frame(name: str) -> int:
+            if name not in frame_ids:
+                frame_ids[name] = len(frames)
+                frames.append({"name": name})
+            return frame_ids[name]
+
+        origin = min(event["start"] for event in self.events)
+        threads: Dict[str, List[Dict]] = {}
+        for event in sorted(self.events, key=lambda x: (x["start"], x["end"])):
+            threads.setdefault(event["thread"], []).append(event)
+
+        profiles = []
+        for thread, events in threads.items():
+            timeline = []
+            for event in events:
+                start = (event["start"] - origin) / 1e6
+                end = max((event["end"] - origin) / 1e6, start)
+                page_frame = frame(event["page"])
+                stage_frame = frame(event["stage"])
+                timeline += [
+                    {"type": "O", "frame": page_frame, "at": start},
+                    {"type": "O", "frame": stage_frame, "at": start},
+                    {"type": "C", "frame": stage_frame, "at": end},
+                    {"type": "C", "frame": page_frame, "at": end},
+                ]
+            profiles.append(
+                {
+                    "type": "evented",
+                    "name": f"docs build {thread}",
+                    "unit": "milliseconds",
+                    "startValue": timeline[0]["at"],
+                    "endValue": timeline[-1]["at"],
+                    "events": timeline,
+                }
+            )
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+
+build_profiler = BuildProfiler(
+    constants.DOCS_CACHE_DIR / "profile",
+    enabled=os.environ.get("BURIDAN_PROFILE_BUILD") == "true",
+)
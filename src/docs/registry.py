@@ -0,0 +1,158 @@
+import os
+import ast
+import json
+import pathlib
+import importlib
+
+from typing import Callable, Dict, Iterator, Mapping, Tuple
+
+
+# Bump whenever the shape of the persisted index changes.
+INDEX_VERSION = 1
+
+
+def _scan_definitions(py_file: pathlib.Path) -> list[str]:
+    """Returns the names of the top-level functions and classes of a module."""
+    tree = ast.parse(py_file.read_text(), filename=str(py_file))
+    names = [
+        node.name
+        for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+    ]
+    # Match inspect.getmembers ordering, so lowercase collisions resolve the same way.
+    return sorted(set(names))
+
+
+class ComponentRegistry(Mapping[str, Callable]):
+    """A lazy, name-addressable registry of the components in the docs library.
+
+    Directories are indexed statically: every module is parsed with `ast` and
+    its top-level functions and classes are recorded as
+    `name -> (module path, qualname, file)`. The index is persisted between
+    runs and only re-parsed for files whose mtime or size changed. A module is
+    imported the first time one of its names is looked up.
+    """
+
+    def __init__(
+        self,
+        root_dir: pathlib.Path | None = None,
+        index_path: pathlib.Path | None = None,
+    ):
+        self.root_dir = root_dir or pathlib.Path(__file__).parent.parent.parent
+        self.index_path = index_path
+        self._entries: Dict[str, Tuple[str, str, str]] = {}
+        self._loaded: Dict[str, Callable] = {}
+        self._index = self._read_index()
+
+    def register(self, name: str, obj: Callable) -> None:
+        """Registers an already imported component under a name."""
+        self._loaded[name.lower()] = obj
+        self._entries.pop(name.lower(), None)
+
+    def update(self, components: Mapping[str, Callable]) -> None:
+        for name, obj in components.items():
+            self.register(name, obj)
+
+    def scan(self, directory: str | pathlib.Path) -> None:
+        """Statically indexes every module of a directory without importing it."""
+        search_path = self.root_dir / directory
+
+        if not search_path.is_dir():
+            print(f"Warning: Dynamic load directory not found: {directory}")
+            return
+
+        changed = False
+        for py_file in sorted(search_path.rglob("*.py")):
+            if py_file.name.startswith("__"):
+                continue
+
+            relative_py_file = py_file.relative_to(self.root_dir)
+            key = relative_py_file.as_posix()
+            stat = py_file.stat()
+
+            cached = self._index.get(key)
+            if (
+                cached
+                and cached["mtime_ns"] == stat.st_mtime_ns
+                and cached["size"] == stat.st_size
+            ):
+                names = cached["names"]
+            else:
+                try:
+                    names = _scan_definitions(py_file)
+                except (SyntaxError, ValueError, OSError) as e:
+                    print(f"Error indexing components from {key}: {e}")
+                    continue
+                self._index[key] = {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "names": names,
+                }
+                changed = True
+
+            module_path = ".".join(relative_py_file.with_suffix("").parts)
+            for name in names:
+                self._entries[name.lower()] = (module_path, name, str(py_file))
+
+        if changed:
+            self._write_index()
+
+    def locate(self, name: str) -> Tuple[str, str, str] | None:
+        """Returns `(module path, qualname, file)` for a name without importing it.
+
+        Components registered as objects are not indexed and return None.
+        """
+        return self._entries.get(name.lower())
+
+    def __getitem__(self, name: str) -> Callable:
+        name = name.lower()
+        if name in self._loaded:
+            return self._loaded[name]
+
+        module_path, qualname, _ = self._entries[name]
+        try:
+            obj = importlib.import_module(module_path)
+            for attr in qualname.split("."):
+                obj = getattr(obj, attr)
+        except Exception as e:
+            print(f"Error loading components from module {module_path}: {e}")
+            raise KeyError(name) from e
+
+        self._loaded[name] = obj
+        return obj
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and (
+            name.lower() in self._loaded or name.lower() in self._entries
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._entries
+        yield from (name for name in self._loaded if name not in self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries.keys() | self._loaded.keys())
+
+    def _read_index(self) -> Dict[str, Dict]:
+        if not self.index_path:
+            return {}
+        try:
+            index = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if index.get("version") != INDEX_VERSION:
+            return {}
+        return index.get("files", {})
+
+    def _write_index(self) -> None:
+        if not self.index_path:
+            return
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps({"version": INDEX_VERSION, "files": self._index})
+            )
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"Warning: Could not write component index: {e}")
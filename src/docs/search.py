@@ -0,0 +1,210 @@
+import os
+import re
+import json
+import hashlib
+import functools
+
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import reflex as rx
+
+import src.routes as routes
+from src.docs.constants import DOC_DIRECTIVE_PATTERN, DOCS_CACHE_DIR
+from src.docs.corpus import DocCorpus, DocPage, load_corpus
+
+
+# Served by the frontend at `/search/<name>.<hash>.json`, see `assets/js/search.js`.
+SEARCH_ASSETS_DIR = Path("assets") / "search"
+
+SEARCH_INDEX_VERSION = 1
+
+# Backend route of the server-side search, see `src/docs/search_server.py`.
+SEARCH_API_PATH = "/api/search"
+
+# Term frequencies are weighted by where a term appears.
+TITLE_WEIGHT = 3
+HEADING_WEIGHT = 2
+TEXT_WEIGHT = 1
+
+# Too common to tell documents apart, dropped from the index and from queries.
+STOP_WORDS = frozenset(
+    "a an and are as at be by can for from in is it of on or that the this "
+    "to with you your".split()
+)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_HEADING_PATTERN = re.compile(r"^#{1,2}\s+(.+)$")
+# Markup whose text is not worth indexing: link targets and HTML tags.
+_MARKUP_PATTERN = re.compile(r"\]\([^)]*\)|<[^>]+>")
+
+
+def search_mode() -> str:
+    """Where the search dialog runs queries, set with BURIDAN_SEARCH_MODE.
+
+    `client` (default) ships the index as a static asset and queries it in the
+    browser. `server` keeps the pages' text on the backend and queries the
+    SQLite index behind `/api/search`, see `src/docs/search_server.py`.
+    """
+    return "server" if os.environ.get("BURIDAN_SEARCH_MODE") == "server" else "client"
+
+
+def search_items() -> List[Dict[str, str]]:
+    """Every docs page the search dialog lists, as `{title, url}`."""
+    return (
+        routes.GET_STARTED_URLS
+        + routes.BASE_UI_COMPONENTS
+        + routes.CHARTS_URLS
+        + routes.JS_INTEGRATIONS_URLS
+        + routes.WRAPPED_COMPONENTS_URLS
+    )
+
+
+def publish_search_asset(name: str, payload) -> str | None:
+    """Writes `payload` as a content-hashed JSON asset and returns its URL.
+
+    The hash pins the content, so browsers can cache the file for good and
+    a docs change simply produces a new URL. Older versions of the asset
+    are removed. The file is written under the cache directory first, a
+    temp file in `assets/` would trigger the dev server's hot reload.
+    Returns None if the file could not be written.
+    """
+    data = json.dumps(payload, separators=(",", ":"))
+    digest = hashlib.sha256(data.encode()).hexdigest()[:12]
+    path = SEARCH_ASSETS_DIR / f"{name}.{digest}.json"
+
+    if not path.exists():
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            DOCS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = DOCS_CACHE_DIR / f"{path.name}.{os.getpid()}.tmp"
+            tmp_path.write_text(data, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: Could not write search asset {path}: {e}")
+            return None
+
+    for stale in SEARCH_ASSETS_DIR.glob(f"{name}.*.json"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+
+    return f"/search/{path.name}"
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric terms, the same split `search.js` applies to queries."""
+    return [
+        token
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if token not in STOP_WORDS
+    ]
+
+
+def page_sections(page: DocPage) -> List[Tuple[str, str]]:
+    """Splits a page into `(heading, prose)` pairs, in order.
+
+    The first pair is the page itself, with an empty heading and the prose
+    before the first heading. Code blocks and directives are left out, and
+    headings are the level 1-2 headings outside code blocks, whose text is
+    also their anchor id.
+    """
+    sections = [("", [])]
+    in_fence = False
+    for line in page.body.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        match = _HEADING_PATTERN.match(line)
+        if match:
+            sections.append((match.group(1).strip(), []))
+            continue
+        sections[-1][1].append(line)
+
+    return [
+        (
+            heading,
+            _MARKUP_PATTERN.sub(
+                " ", re.sub(DOC_DIRECTIVE_PATTERN, " ", "\n".join(lines))
+            ),
+        )
+        for heading, lines in sections
+    ]
+
+
+def search_documents(
+    corpus: DocCorpus, items: List[Dict[str, str]]
+) -> Iterator[Tuple[str, str, str, str]]:
+    """Yields `(title, url, heading, text)` for everything search can return.
+
+    Every page yields one document for itself and one per heading, so results
+    can link straight to an anchor. Pages come in the order of `items`.
+    """
+    for item in items:
+        page = corpus.get(item["url"].removeprefix("docs/"))
+        if page is None:
+            continue
+        title = item["title"]
+        sections = page_sections(page)
+        # A heading repeating the title (usually the h1) belongs to the page itself.
+        intro = " ".join(text for heading, text in sections if heading in ("", title))
+        yield title, item["url"], "", intro
+        for heading, text in sections:
+            if heading not in ("", title):
+                yield title, item["url"], heading, text
+
+
+def build_search_index(corpus: DocCorpus, items: List[Dict[str, str]]) -> Dict:
+    """Builds the full-text index the search dialog queries in the browser.
+
+    `terms` is sorted, which lets the client expand a query prefix with a
+    binary search. `postings[i]` lists `doc, tf` pairs of `terms[i]`
+    flattened into one array, ranked with BM25 over the weighted term
+    frequencies and document lengths.
+    """
+    docs: List[List[str]] = []
+    lengths: List[int] = []
+    postings: Dict[str, List[int]] = {}
+
+    for title, url, heading, text in search_documents(corpus, items):
+        if heading:
+            fields = [(heading, HEADING_WEIGHT), (title, TEXT_WEIGHT)]
+        else:
+            fields = [(title, TITLE_WEIGHT)]
+        fields.append((text, TEXT_WEIGHT))
+
+        frequencies: Dict[str, int] = {}
+        for field, weight in fields:
+            for token in tokenize(field):
+                frequencies[token] = frequencies.get(token, 0) + weight
+        doc_id = len(docs)
+        docs.append([title, url, heading])
+        lengths.append(sum(frequencies.values()))
+        for token, frequency in frequencies.items():
+            postings.setdefault(token, []).extend((doc_id, frequency))
+
+    terms = sorted(postings)
+    return {
+        "version": SEARCH_INDEX_VERSION,
+        "docs": docs,
+        "lengths": lengths,
+        "avgLength": round(sum(lengths) / max(len(lengths), 1), 3),
+        "terms": terms,
+        "postings": [postings[term] for term in terms],
+        "stopWords": sorted(STOP_WORDS),
+    }
+
+
+@functools.cache
+def search_index() -> Dict:
+    return build_search_index(load_corpus(), search_items())
+
+
+@functools.cache
+def search_index_url() -> str | None:
+    return publish_search_asset("index", search_index())
+
+
+def search_loader_script() -> rx.Component:
+    return rx.script(src="/js/search.js")
@@ -0,0 +1,208 @@
+import os
+import html
+import queue
+import asyncio
+import sqlite3
+import threading
+import contextlib
+
+from pathlib import Path
+from typing import Dict, Iterator
+from urllib.parse import quote
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+import src.docs.constants as constants
+from src.docs.corpus import load_corpus
+from src.docs.search import (
+    SEARCH_API_PATH,
+    search_documents,
+    search_items,
+    tokenize,
+)
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 50
+
+# Seconds a query waits for a pooled connection before giving up.
+POOL_TIMEOUT = 5
+
+# bm25() weights of the title, heading, body and url columns.
+COLUMN_WEIGHTS = (3.0, 2.0, 1.0, 0.0)
+
+# Snippet match markers, swapped for <mark> once the text is escaped.
+_MATCH_START = "\x02"
+_MATCH_END = "\x03"
+
+
+def build_search_db(path: Path) -> None:
+    """Writes every search document into an FTS5 table at `path`.
+
+    The database is built next to the final file and swapped in, so readers
+    never see a partial index.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    connection = sqlite3.connect(tmp_path)
+    try:
+        connection.execute(
+            "CREATE VIRTUAL TABLE docs USING fts5("
+            "title, heading, body, url UNINDEXED, "
+            "tokenize='porter unicode61', prefix='2 3')"
+        )
+        connection.executemany(
+            "INSERT INTO docs (title, heading, body, url) VALUES (?, ?, ?, ?)",
+            (
+                (title, heading, " ".join(text.split()), url)
+                for title, url, heading, text in search_documents(
+                    load_corpus(), search_items()
+                )
+            ),
+        )
+        connection.commit()
+    finally:
+        connection.close()
+    os.replace(tmp_path, path)
+
+
+class SearchDatabase:
+    """Read-only access to the docs search database.
+
+    The database is built with the docs pages, see `build`, so the first
+    query does not pay for it. Queries borrow one of at most `pool_size`
+    connections, so they can run in worker threads next to each other
+    without opening a connection per request.
+    """
+
+    def __init__(self, path: Path, pool_size: int = 4):
+        self.path = path
+        self.pool_size = pool_size
+        self._pool: queue.Queue[sqlite3.Connection] = queue.Queue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def build(self) -> None:
+        """Builds the database from the docs, queries fail until it exists."""
+        try:
+            build_search_db(self.path)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: Could not build the search database: {e}")
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        connection = self._acquire()
+        try:
+            yield connection
+        finally:
+            self._pool.put(connection)
+
+    def _acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            try:
+                return self._pool.get_nowait()
+            except queue.Empty:
+                if self._opened < self.pool_size:
+                    # Fails while the database is not built, the slot stays free.
+                    connection = sqlite3.connect(
+                        f"file:{self.path}?mode=ro",
+                        uri=True,
+                        check_same_thread=False,
+                    )
+                    self._opened += 1
+                    return connection
+        try:
+            return self._pool.get(timeout=POOL_TIMEOUT)
+        except queue.Empty:
+            raise sqlite3.OperationalError("no search connection available")
+
+    def search(
+        self, query: str, page: int = 0, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Dict:
+        """Ranked results for a query, a page at a time.
+
+        Every query term matches as a prefix and all of them must match. An
+        empty query lists the pages themselves, in sidebar order.
+        """
+        tokens = tokenize(query)
+        if tokens:
+            match = " ".join(f'"{token}"*' for token in tokens)
+            weights = ", ".join(str(weight) for weight in COLUMN_WEIGHTS)
+            sql = (
+                f"SELECT title, url, heading, snippet(docs, 2, ?, ?, '...', 12) "
+                f"FROM docs WHERE docs MATCH ? ORDER BY bm25(docs, {weights}) "
+                "LIMIT ? OFFSET ?"
+            )
+            params = (_MATCH_START, _MATCH_END, match, page_size, page * page_size)
+            count_sql = "SELECT count(*) FROM docs WHERE docs MATCH ?"
+            count_params = (match,)
+        else:
+            sql = (
+                "SELECT title, url, heading, '' FROM docs WHERE heading = '' "
+                "ORDER BY rowid LIMIT ? OFFSET ?"
+            )
+            params = (page_size, page * page_size)
+            count_sql = "SELECT count(*) FROM docs WHERE heading = ''"
+            count_params = ()
+
+        with self.connection() as connection:
+            rows = connection.execute(sql, params).fetchall()
+            total = connection.execute(count_sql, count_params).fetchone()[0]
+
+        return {
+            "query": query,
+            "page": page,
+            "pageSize": page_size,
+            "total": total,
+            "results": [_result(*row) for row in rows],
+        }
+
+
+def _result(title: str, url: str, heading: str, snippet: str) -> Dict[str, str]:
+    anchor = f"#{quote(heading, safe='')}" if heading else ""
+    return {
+        "title": title,
+        "url": url,
+        "heading": heading,
+        "href": f"/{url}{anchor}",
+        "snippet": html.escape(snippet)
+        .replace(_MATCH_START, "<mark>")
+        .replace(_MATCH_END, "</mark>"),
+    }
+
+
+search_database = SearchDatabase(constants.DOCS_CACHE_DIR / "search.sqlite3")
+
+
+async def search_endpoint(request: Request) -> JSONResponse:
+    """`GET /api/search?q=<query>&page=<n>&page_size=<n>`"""
+    params = request.query_params
+    try:
+        page = max(int(params.get("page", 0)), 0)
+        page_size = min(
+            max(int(params.get("page_size", DEFAULT_PAGE_SIZE)), 1), MAX_PAGE_SIZE
+        )
+    except ValueError:
+        return JSONResponse(
+            {"error": "page and page_size must be integers"}, status_code=400
+        )
+
+    # SQLite calls block, keep them off the event loop.
+    try:
+        result = await asyncio.to_thread(
+            search_database.search, params.get("q", ""), page, page_size
+        )
+    except (sqlite3.Error, OSError) as e:
+        print(f"Warning: Search query failed: {e}")
+        return JSONResponse({"error": "search is unavailable"}, status_code=503)
+    return JSONResponse(result)
+
+
+# Passed to `rx.App(api_transformer=...)`, which mounts the Reflex backend inside.
+search_api = Starlette(
+    routes=[Route(SEARCH_API_PATH, search_endpoint, methods=["GET"])]
+)
@@ -0,0 +1,91 @@
+import os
+import ast
+
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+
+@dataclass
+class ModuleSource:
+    """The text of a module and the line spans of its top-level definitions."""
+
+    mtime_ns: int
+    size: int
+    text: str
+    lines: list[str]
+    spans: Dict[str, Tuple[int, int]]  # qualname -> (first line, last line)
+
+
+class SourceIndex:
+    """Source lookups for the docs library, parsed once per module.
+
+    Every module is read and parsed with `ast` the first time one of its
+    definitions is requested. Functions and classes map to their exact source
+    span (decorators included), so extracting one is a slice of the cached
+    lines instead of another pass of `inspect`, `linecache` and the tokenizer.
+    An entry is re-parsed when the file's mtime or size changes.
+    """
+
+    def __init__(self):
+        self._modules: Dict[str, ModuleSource] = {}
+
+    def file(self, path: str) -> str:
+        """Returns the whole text of a source file."""
+        return self._module(path).text
+
+    def definition(self, path: str, qualname: str) -> str | None:
+        """Returns the source of a definition in a file, or None if missing."""
+        module = self._module(path)
+        span = module.spans.get(qualname)
+        if span is None:
+            return None
+        start, end = span
+        return "".join(module.lines[start - 1 : end])
+
+    def _module(self, path: str) -> ModuleSource:
+        stat = os.stat(path)
+        module = self._modules.get(path)
+        if (
+            module
+            and module.mtime_ns == stat.st_mtime_ns
+            and module.size == stat.st_size
+        ):
+            return module
+
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        module = ModuleSource(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            text=text,
+            lines=text.splitlines(keepends=True),
+            spans=self._scan_spans(ast.parse(text, filename=path)),
+        )
+        self._modules[path] = module
+        return module
+
+    @staticmethod
+    def _scan_spans(tree: ast.Module) -> Dict[str, Tuple[int, int]]:
+        spans = {}
+        nodes = [(node, "") for node in tree.body]
+        # Walk in file order, so a redefined name maps to its last definition
+        # like it does at runtime.
+        for node, prefix in nodes:
+            if not isinstance(
+                node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+            ):
+                continue
+
+            qualname = f"{prefix}{node.name}"
+            # Like `inspect.getsource`, a definition starts at its first decorator.
+            start = (
+                node.decorator_list[0].lineno if node.decorator_list else node.lineno
+            )
+            spans[qualname] = (start, node.end_lineno)
+
+            if isinstance(node, ast.ClassDef):
+                nodes.extend((child, f"{qualname}.") for child in node.body)
+        return spans
+
+
+source_index = SourceIndex()
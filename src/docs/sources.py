@@ -0,0 +1,73 @@
+import os
+import json
+import hashlib
+
+from pathlib import Path
+
+import reflex as rx
+
+from src.docs.constants import DOCS_CACHE_DIR
+from src.docs.highlight import highlight_code, highlighting_enabled
+
+
+# Served by the frontend at `/sources/<key>.json`, see `assets/js/sources.js`.
+SOURCES_ASSETS_DIR = Path("assets") / "sources"
+
+
+def lazy_sources_enabled() -> bool:
+    """Whether long source listings are fetched on demand instead of inlined.
+
+    Published listings are pre-highlighted, so this needs build-time
+    highlighting. BURIDAN_LAZY_SOURCES=false inlines them again.
+    """
+    return (
+        highlighting_enabled()
+        and os.environ.get("BURIDAN_LAZY_SOURCES", "true") != "false"
+    )
+
+
+def block_key(content: str, language: str, line_numbers: bool) -> str:
+    """A stable id for a code block, derived from what it displays.
+
+    Content only known in the browser (a markdown Var) is keyed by its JS
+    expression, which is just as stable between builds.
+    """
+    return hashlib.sha256(
+        f"{language}\n{int(line_numbers)}\n{content!s}".encode()
+    ).hexdigest()[:20]
+
+
+def publish_source(content: str, language: str, line_numbers: bool) -> str | None:
+    """Writes a listing as a static asset and returns its content-hashed key.
+
+    `<key>.json` holds the highlighted markup and the raw text for the copy
+    button. An existing file is never rewritten, its key already pins its
+    content. JSON is also ignored by the dev server's hot reload, so the file
+    is written under the cache directory first and only moved into `assets/`
+    once complete. Returns None if the file could not be written.
+    """
+    key = block_key(content, language, line_numbers)
+
+    path = SOURCES_ASSETS_DIR / f"{key}.json"
+    if path.exists():
+        return key
+
+    payload = {
+        "html": highlight_code(content, language, line_numbers),
+        "text": content,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        DOCS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = DOCS_CACHE_DIR / f"{path.name}.{os.getpid()}.tmp"
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: Could not write source asset {path}: {e}")
+        return None
+
+    return key
+
+
+def source_loader_script() -> rx.Component:
+    return rx.script(src="/js/sources.js")
@@ -1,10 +1,15 @@
-import random
-import string
+import itertools
+from typing import Dict, Iterator
 
 import reflex as rx
-from reflex.experimental import ClientStateVar
 
+from src.docs.highlight import (
+    HIGHLIGHT_CLASS_PREFIX,
+    highlight_code,
+    highlighting_enabled,
+)
 from src.docs.library.base_ui.icons.hugeicon import hi
+from src.docs.sources import block_key, lazy_sources_enabled, publish_source
 
 # --- Markdown Styles ---
 PARAGRAPH_CLASS = "text-sm leading-6 pb-4"
@@ -13,12 +18,13 @@ HEADING_2_CLASS = "text-xl py-1"
 LIST_ITEM_CLASS = "text-sm text-slate-11"
 LINK_CLASS = "text-accent-8"
 CODE_BLOCK_CLASS = "!rounded-xl !bg-transparent !overflow-y-auto"
+CODE_BLOCK_WRAPPER_CLASS = (
+    "w-full rounded-[0.625rem] relative bg-input/18 outline outline-input mb-4"
+)
 
 
-# --- Helper functions to generate ClientStateVar names ---
-def generate_component_id():
-    """Generate a unique component ID."""
-    return "".join(random.choices(string.ascii_letters + string.digits, k=10))
+# Occurrences of each code block so far, see `_copy_id`.
+_copy_counts: Dict[str, Iterator[int]] = {}
 
 
 # --- Helper error functions during parsing ---
@@ -51,6 +57,7 @@ def render_codeblock(
     copy_button: bool = False,
     line_num: bool = False,
     can_scroll: bool = False,
+    lazy: bool = False,
     **props,
 ) -> rx.Component:
     # Use the following to make line numbers sticky when horizontally scrolling...
@@ -67,69 +74,117 @@ def render_codeblock(
     #     }
     # },
 
-    if copy_button:
-        _id = generate_component_id()
-        is_copied = ClientStateVar.create(var_name=f"is_copied_{_id}", default=False)
+    # Lazy listings are published as static assets and only fetched once
+    # shown, instead of being inlined in the page (twice, with the copy button).
+    published = False
+    if lazy and isinstance(content, str) and lazy_sources_enabled():
+        published = publish_source(content, lang, line_num) is not None
+
+    # Derived from the content, so rebuilding the same sources gives the same page.
+    key = block_key(content, lang, line_num)
+    copy_id = _copy_id(key)
+
+    if published:
+        copy_actions = [
+            rx.call_script(f"window.buridanSources.copy('{key}', '{copy_id}')")
+        ]
+    else:
+        copy_actions = [
+            rx.set_clipboard(content),
+            rx.call_script(f"window.buridanSources.markCopied('{copy_id}')"),
+        ]
 
     return rx.el.div(
         rx.scroll_area(
-            rx.code_block(
+            _code_block(
                 content,
-                font_size="14px",
-                language=lang,
-                show_line_numbers=line_num,
-                code_tag_props={
-                    "pre": "transparent",
-                    "background": "transparent",
-                },
-                custom_attrs={
-                    "background": "transparent !important",
-                    "pre": {"background": "transparent !important"},
-                    "code": {"background": "transparent !important"},
-                },
-                background="transparent !important",
-                class_name=CODE_BLOCK_CLASS,
+                lang,
+                line_num,
+                large=True,
+                source_key=key if published else None,
             ),
             class_name="h-[65vh] overflow-y-scroll",
         )
         if can_scroll
-        else rx.code_block(
-            content,
-            font_size="13px",
-            language=lang,
-            show_line_numbers=line_num,
-            code_tag_props={
-                "pre": "transparent",
-                "background": "transparent",
-            },
-            custom_attrs={
-                "background": "transparent !important",
-                "pre": {"background": "transparent !important"},
-                "code": {"background": "transparent !important"},
-            },
-            background="transparent !important",
-            class_name=CODE_BLOCK_CLASS,
+        else _code_block(
+            content, lang, line_num, source_key=key if published else None
         ),
         (
+            # The shared controller flags copied buttons with `data-copied`
+            # for a moment, no client state is created per block.
             rx.el.button(
-                rx.cond(
-                    is_copied.value,
-                    hi("Tick01Icon", class_name="size-4"),
-                    hi("Copy01Icon", class_name="size-4"),
-                ),
-                class_name="cursor-pointer flex items-center justify-center absolute top-[15px] right-[15px]",
-                on_click=[
-                    rx.call_function(is_copied.set_value(True)),
-                    rx.set_clipboard(content),
-                ],
-                on_mouse_down=rx.call_function(is_copied.set_value(False)).debounce(
-                    1500
-                ),
+                hi("Copy01Icon", class_name="size-4 group-data-[copied]:hidden"),
+                hi("Tick01Icon", class_name="size-4 hidden group-data-[copied]:block"),
+                class_name="group cursor-pointer flex items-center justify-center absolute top-[15px] right-[15px]",
+                custom_attrs={"data-copy": copy_id},
+                on_click=copy_actions,
             )
             if copy_button
             else rx.el.div(class_name="hidden")
         ),
-        class_name="w-full rounded-[0.625rem] relative bg-input/18 outline outline-input mb-4",
+        class_name=CODE_BLOCK_WRAPPER_CLASS,
+    )
+
+
+def _copy_id(key: str) -> str:
+    """The `data-copy` id of a copy button. Identical blocks share their
+    content key, so repeats get a counter suffix to only flag the clicked one."""
+    occurrence = next(_copy_counts.setdefault(key, itertools.count()))
+    return key if occurrence == 0 else f"{key}-{occurrence}"
+
+
+def render_codeblock_html(content: str, lang: str = "python") -> str:
+    """Static markup of `render_codeblock(content, lang)`, for pages that embed
+    code in prerendered HTML. Needs build-time highlighting."""
+    return (
+        f'<div class="{CODE_BLOCK_WRAPPER_CLASS}">'
+        f'<div class="rx-Html {CODE_BLOCK_CLASS}">{highlight_code(content, lang)}</div>'
+        '<div class="hidden"></div>'
+        "</div>"
+    )
+
+
+def _code_block(
+    content: str,
+    lang: str,
+    line_num: bool,
+    large: bool = False,
+    source_key: str | None = None,
+) -> rx.Component:
+    class_name = (
+        f"{CODE_BLOCK_CLASS} {HIGHLIGHT_CLASS_PREFIX}lg" if large else CODE_BLOCK_CLASS
+    )
+
+    # An empty placeholder, filled with the published listing once mounted.
+    if source_key:
+        return rx.el.div(
+            class_name=class_name,
+            custom_attrs={"data-source": source_key},
+            on_mount=rx.call_script(f"window.buridanSources.render('{source_key}')"),
+        )
+
+    # Source known at build time is tokenized once in Python and shipped as
+    # static markup. Markdown code blocks only receive their content in the
+    # browser, so they keep the client-side highlighter.
+    if isinstance(content, str) and highlighting_enabled():
+        return rx.html(highlight_code(content, lang, line_num), class_name=class_name)
+
+    return rx.code_block(
+        content,
+        font_size="14px" if large else "13px",
+        language=lang,
+        show_line_numbers=line_num,
+        code_tag_props={
+            "pre": "transparent",
+            "background": "transparent",
+        },
+        custom_attrs={
+            "background": "transparent !important",
+            "pre": {"background": "transparent !important"},
+            "code": {"background": "transparent !important"},
+        },
+        background="transparent !important",
+        class_name=CODE_BLOCK_CLASS,
     )
 
 
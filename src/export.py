@@ -2,7 +2,10 @@ import reflex as rx
 
 import src.meta as meta
 import src.routes as routes
-from src.docs.generator import generate_docs_library
+from src.docs.generator import iter_docs_library
+from src.docs.profiler import build_profiler
+from src.docs.search import search_mode
+from src.docs.search_server import search_database
 from src.templates.docpage import docpage
 from src.templates.toc import table_of_content
 from src.views.landing.landing import site_landing_page
@@ -38,17 +41,32 @@ def export(app: rx.App):
             on_load=lambda target=target: rx.redirect(target),
         )
 
-    # Add all the documentation pages
-    for doc in generate_docs_library():
-        main_content = rx.el.div(*doc.component, class_name="w-full")
-        toc_content = table_of_content(doc.url, doc.table_of_content)
+    # Add all the documentation pages. Reflex keeps every registered page's
+    # components until it compiles them, so streaming does not lower the
+    # peak memory, see `scripts/memory_report.py`
+    for doc in iter_docs_library():
+        with build_profiler.page(doc.url):
+            with build_profiler.stage("components"):
+                main_content = rx.el.div(*doc.component, class_name="w-full")
+                toc_content = table_of_content(doc.url, doc.table_of_content)
+                page = docpage(main_content, toc_content)
 
         title_s = doc.url.split("/")[-1].replace("-", " ").title()
         title = f"{title_s} – buridan/ui"
 
+        # Not profiled: add_page only records the page, Reflex compiles it
+        # later in `App._compile`
         app.add_page(
-            docpage(main_content, toc_content),
+            page,
             route=f"/{doc.url}",
             title=title,
             meta=meta.SITE_META_TAGS,
         )
+
+    # The server-side search index is built along with the pages, not on
+    # the first query
+    if search_mode() == "server":
+        search_database.build()
+
+    # Prints the timing report when BURIDAN_PROFILE_BUILD=true
+    build_profiler.finish()
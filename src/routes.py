@@ -1,15 +1,13 @@
-import os
-import glob
-
 import src.docs.constants as constants
-from src.utils.frontmatter import parse_frontmatter
+
+from src.docs.manifest import load_route_manifest
 
 
 # --- Method: Generate doc routes/urls ---
 def generate_doc_routes(section_folder, base_path) -> list[dict]:
     """
-    Generates routes for a documentation section by recursively reading
-    frontmatter from markdown files.
+    Generates routes for a documentation section from the persisted route
+    manifest, which holds the frontmatter of its markdown files.
 
     Args:
         section_folder: The folder name inside 'docs/' (e.g., 'getting_started').
@@ -18,39 +16,22 @@ def generate_doc_routes(section_folder, base_path) -> list[dict]:
     Returns:
         A list of route dictionaries, sorted by the 'order' in metadata.
     """
-    routes = []
-    docs_path = f"{constants.DOCS_BASE_DIR}/{section_folder}"
-    search_path = os.path.join(docs_path, "**/*.md")
+    pages = load_route_manifest().get(section_folder)
 
-    md_files = glob.glob(search_path, recursive=True)
-
-    if not md_files:
-        print(f"Warning: No markdown files found in '{docs_path}'")
+    if pages is None:
+        print(
+            f"Warning: No markdown files found in '{constants.DOCS_BASE_DIR / section_folder}'"
+        )
         return []
 
-    for file_path in md_files:
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-        except FileNotFoundError:
-            continue
-
-        metadata, _ = parse_frontmatter(content)
-
-        if not metadata or "title" not in metadata:
-            continue
-
-        # Create a URL slug from the file path relative to the section folder.
-        relative_path = os.path.relpath(file_path, docs_path)
-        path_slug = relative_path.replace(".md", "").replace("_", "-")
-
-        route_info = {
-            "title": metadata["title"],
-            "url": f"{base_path}{path_slug}",  # Will include docs/ prefix
-            "order": metadata.get("order", 0),
+    routes = [
+        {
+            "title": page["title"],
+            "url": f"{base_path}{page['slug']}",  # Will include docs/ prefix
+            "order": page["order"],
         }
-
-        routes.append(route_info)
+        for page in pages
+    ]
 
     routes.sort(key=lambda x: x["order"])
 
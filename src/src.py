@@ -1,6 +1,9 @@
 import reflex as rx
 
 from src.export import export
+from src.docs.search import search_loader_script, search_mode
+from src.docs.search_server import search_api
+from src.docs.sources import source_loader_script
 from src.docs.library.javascript_integrations.fuse.fuse import (
     fuse_cdn_script,
     load_json_file_and_initialize,
@@ -30,9 +33,13 @@ def site_tracking_script() -> rx.Script:
 
 # --- Reflex app init ---
 app = rx.App(
-    stylesheets=["css/wrapper.css"],
+    stylesheets=["css/wrapper.css", "css/highlight.css"],
+    # Serves `/api/search` for BURIDAN_SEARCH_MODE=server.
+    api_transformer=search_api if search_mode() == "server" else None,
     head_components=[
         site_tracking_script(),
+        source_loader_script(),
+        search_loader_script(),
         fuse_cdn_script(),
         custom_search_script(),
         minisearch_cdn_script(),
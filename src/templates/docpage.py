@@ -1,17 +1,21 @@
 import reflex as rx
 
-from src.templates.navbar import main_navbar
-from src.templates.sidebar import sidebar
+from src.templates.navbar import site_navbar
+from src.templates.sidebar import docs_sidebar
 
 
 def docpage(main_content, toc_content):
-    """The template for all documentation pages."""
+    """The template for all documentation pages.
+
+    The navbar and sidebar are shared memo components, so only the page body
+    and the TOC are compiled per page.
+    """
     return rx.el.body(
         rx.el.div(
-            rx.el.header(main_navbar(), class_name="sticky top-0 z-50"),
+            rx.el.header(site_navbar(), class_name="sticky top-0 z-50"),
             rx.el.main(
                 rx.el.div(
-                    sidebar(),
+                    docs_sidebar(),
                     rx.el.div(
                         rx.el.div(
                             rx.el.div(
@@ -56,3 +56,13 @@ def main_navbar():
         ),
         class_name="bg-background w-full h-12 sticky top-0 left-0 px-0 py-7 items-center justify-between flex flex-row z-[99999]",
     )
+
+
+@rx.memo
+def site_navbar() -> rx.Component:
+    """`main_navbar` compiled once into a shared component.
+
+    Pages only reference it, instead of each carrying its own copy of the
+    navigation and the drawer's full sidebar.
+    """
+    return main_navbar()
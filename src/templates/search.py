@@ -1,10 +1,27 @@
+import json
+
 import reflex as rx
 
+from reflex.config import get_config
+from reflex.event import EventChain
+from reflex.vars import FunctionStringVar
+
 import src.hooks as hooks
+from src.docs.search import (
+    SEARCH_API_PATH,
+    search_index,
+    search_index_url,
+    search_mode,
+)
 from src.docs.library.base_ui.components.base.button import button
 from src.docs.library.base_ui.components.base.input_group import input_with_addons
 from src.docs.library.base_ui.icons.hugeicon import hi
 
+# Results have a fixed height, so `search.js` can tell which rows are in view
+# from the scroll offset alone. Server results have a snippet line.
+RESULT_ROW_HEIGHT = 40
+SNIPPET_ROW_HEIGHT = 56
+
 
 def icon_for_url(url: str):
     """UI helper for picking an icon — logic unchanged."""
@@ -27,33 +44,55 @@ def icon_for_url(url: str):
     )
 
 
+def result_row_height() -> int:
+    return SNIPPET_ROW_HEIGHT if search_mode() == "server" else RESULT_ROW_HEIGHT
+
+
 def result_row(value: dict):
     """Reusable UI fragment for each search result row."""
     return rx.el.a(
         rx.el.div(
             icon_for_url(value["url"]),
-            rx.el.p(value["title"], class_name="text-sm font-medium"),
-            class_name="w-full flex flex-row gap-x-2 items-center",
+            rx.el.p(value["title"], class_name="text-sm font-medium shrink-0"),
+            rx.cond(
+                value["heading"],
+                rx.el.p(
+                    value["heading"],
+                    class_name="text-sm text-muted-foreground truncate",
+                ),
+            ),
+            class_name="w-full flex flex-row gap-x-2 items-center min-w-0",
+        ),
+        # Only results of the server-side search carry a highlighted snippet.
+        rx.cond(
+            value["snippet"],
+            rx.html(
+                value["snippet"],
+                class_name=(
+                    "text-xs text-muted-foreground truncate pl-6 "
+                    "[&_mark]:bg-transparent [&_mark]:text-foreground"
+                ),
+            ),
         ),
-        to=f"/{value['url']}",
+        to=value["href"],
+        height=f"{result_row_height()}px",
         class_name=(
-            "w-full flex px-2 py-1.5 rounded-lg hover:bg-input/40 "
-            "hover:ring-1 hover:ring-input hover:ring-offset-0"
+            "w-full flex flex-col justify-center shrink-0 px-2 rounded-lg "
+            "hover:bg-input/40 hover:ring-1 hover:ring-input hover:ring-offset-0"
         ),
     )
 
 
-def result_list(items, condition_fn=None):
-    """List container with optional condition logic (logic unchanged)."""
+def result_list(results):
+    """The results in view, placed within a spacer as tall as the full list."""
     return rx.el.div(
-        rx.foreach(
-            items,
-            lambda value: rx.cond(
-                condition_fn(value) if condition_fn else True,
-                result_row(value),
-            ),
+        rx.el.div(
+            rx.foreach(results["rows"].to(list[dict[str, str]]), result_row),
+            transform=f"translateY({results['offset'].to(int)}px)",
+            class_name="w-full flex flex-col",
         ),
-        class_name="w-full h-full flex flex-col px-1 py-1 gap-y-2",
+        height=f"{results['height'].to(int)}px",
+        class_name="w-full relative px-1 my-1",
     )
 
 
@@ -74,7 +113,10 @@ def search_input():
             prefix=rx.icon("search", size=16, class_name="!text-muted-foreground"),
             placeholder="Search documentation...",
             class_name="pl-2 rounded-radius",
-            on_change=lambda value: hooks.search_query.set_value(value),
+            # Queries run in `search.js`, which only sets the rows in view.
+            on_change=FunctionStringVar.create(
+                "(event) => window.buridanSearch.query(event.target.value)"
+            ).to(FunctionStringVar, EventChain),
         ),
         class_name="w-full h-10 absolute top-0 left-0 flex z-[99] px-3 py-2",
     )
@@ -83,26 +125,29 @@ def search_input():
 def search_content():
     """Scrollable content, UI only refactored."""
     return rx.el.div(
-        rx.scroll_area(
-            rx.cond(
-                hooks.search_query.value,
-                result_list(
-                    hooks.search_items_cs.value.to(list[dict[str, str]]),
-                    lambda v: v["title"]
-                    .lower()
-                    .contains(hooks.search_query.value.to(str).lower()),
-                ),
-                result_list(
-                    hooks.search_items_cs.value.to(list[dict[str, str]]),
-                ),
-            ),
-            class_name=(
-                "w-full h-full pt-10.5 "
-                "[&_.rt-ScrollAreaScrollbar]:mt-[3rem] "
-                "[&_.rt-ScrollAreaScrollbar]:mb-[1rem]"
-            ),
+        # `search.js` finds the scroll container by this attribute.
+        rx.el.div(
+            result_list(hooks.search_results.value.to(dict)),
+            custom_attrs={"data-search-results": ""},
+            class_name="w-full h-full overflow-y-auto",
         ),
-        class_name="w-full h-full",
+        class_name="w-full h-full pt-10.5",
+    )
+
+
+def load_search_index():
+    """Loads the search index the first time the dialog opens.
+
+    In server mode there is nothing to load, queries go to the backend.
+    """
+    if search_mode() == "server":
+        source = {"endpoint": f"{get_config().api_url}{SEARCH_API_PATH}"}
+    else:
+        # Inlined if the asset could not be written.
+        source = {"index": search_index_url() or search_index()}
+    source["rowHeight"] = result_row_height()
+    return rx.call_script(
+        f"window.buridanSearch.open({json.dumps(source)}, {hooks.search_results.set})"
     )
 
 
@@ -115,4 +160,5 @@ def site_search():
             search_content(),
             class_name="outline-2 outline-input h-[25rem] w-[32rem] rounded-radius p-2 relative",
         ),
+        on_open_change=load_search_index(),
     )
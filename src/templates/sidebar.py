@@ -120,3 +120,9 @@ def sidebar(in_drawer=False):
         ),
         class_name=drawer_classes if in_drawer else default_classes,
     )
+
+
+@rx.memo
+def docs_sidebar() -> rx.Component:
+    """The docs sidebar compiled once into a shared component, see `site_navbar`."""
+    return sidebar()
@@ -1,19 +1,36 @@
+from html import escape
 from typing import Dict, List
 
 import reflex as rx
 
+from src.docs.markdown_tree import markdown_render_mode
+
 
 def _create_markdown_toc_links(toc_data: List[Dict]) -> rx.Component:
     """Create markdown TOC links."""
     if not toc_data:
         return rx.el.div()
 
+    def link_class(entry: Dict) -> str:
+        return f"cursor-pointer text-sm font-[450] hover:text-foreground no-underline{' pl-4' if entry['level'] > 1 else ''}"
+
+    # Plain anchors, so they are prerendered along with the page's markdown.
+    if markdown_render_mode() == "islands":
+        return rx.html(
+            "".join(
+                f'<a href="#{escape(entry["id"])}" class="{link_class(entry)}">'
+                f"{escape(entry['text'])}</a>"
+                for entry in toc_data
+            ),
+            class_name="flex flex-col w-full gap-y-2",
+        )
+
     return rx.el.div(
         *[
             rx.el.a(
                 entry["text"],
                 href=f"#{entry['id']}",
-                class_name=f"cursor-pointer text-sm font-[450] hover:text-foreground no-underline{' pl-4' if entry['level'] > 1 else ''}",
+                class_name=link_class(entry),
             )
             for entry in toc_data
         ],
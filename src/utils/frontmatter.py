@@ -1,31 +1,74 @@
-# --- Simple frontmatter parser. ---
+class FrontmatterError(ValueError):
+    """Raised when a markdown file has a malformed frontmatter block."""
+
+
+FRONTMATTER_DELIMITER = "---"
+_CLOSING_FENCE = "\n" + FRONTMATTER_DELIMITER
+
+
+# --- Strict frontmatter parser. ---
 def parse_frontmatter(content: str) -> tuple[dict, str]:
-    """A simple frontmatter parser."""
+    """A strict, single-pass frontmatter parser.
+
+    The block must open on the first line and close with `---` at the start
+    of a line of its own. Only flat `key: value` lines, blank lines and `#`
+    comments are allowed inside it. Content without a leading `---` has no
+    frontmatter.
+
+    Raises:
+        FrontmatterError: If the block is unterminated, has a malformed line
+            or fence, or repeats a key.
+    """
     metadata = {}
-    if not content.startswith("---"):
+    if not content.startswith(FRONTMATTER_DELIMITER):
         return metadata, content
 
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-        return metadata, content
+    # Fences are usually exactly `---`, only other lines are sliced to check
+    # for trailing whitespace.
+    fence_length = len(FRONTMATTER_DELIMITER)
+    opening_end = content.find("\n")
+    if opening_end != fence_length and (
+        opening_end == -1 or content[:opening_end].rstrip() != FRONTMATTER_DELIMITER
+    ):
+        raise FrontmatterError("Malformed frontmatter opening line")
 
-    frontmatter = parts[1]
-    rest_of_content = parts[2]
+    # Find the closing fence first, so only the block is split into lines.
+    closing = content.find(_CLOSING_FENCE, opening_end)
+    if closing == -1:
+        raise FrontmatterError("Unterminated frontmatter block")
+    body_start = content.find("\n", closing + 1)
+    if body_start == -1:
+        body_start = len(content)
+    if (
+        body_start - closing != fence_length + 1
+        and content[closing + 1 : body_start].rstrip() != FRONTMATTER_DELIMITER
+    ):
+        raise FrontmatterError("Malformed frontmatter closing line")
 
-    for line in frontmatter.strip().split("\n"):
-        if ":" in line:
-            key, value = line.split(":", 1)
-            key = key.strip()
-            value = value.strip()
+    lines = content[opening_end + 1 : closing].split("\n")
+    for line in lines:
+        key, separator, value = line.partition(":")
+        key = key.strip()
+        # Keys are identifiers, dashes allowed. Checked without the replace
+        # first, most keys have no dash.
+        if not separator or not (
+            key.isidentifier() or key.replace("-", "_").isidentifier()
+        ):
+            if not line.strip() or key.startswith("#"):
+                continue
+            # An identical line before would have failed already.
+            line_number = lines.index(line) + 2
+            raise FrontmatterError(f"Malformed frontmatter line {line_number}: {line}")
+        if key in metadata:
+            raise FrontmatterError(f"Duplicate frontmatter key '{key}'")
 
-            if (value.startswith('"') and value.endswith('"')) or (
-                value.startswith("'") and value.endswith("'")
-            ):
-                value = value[1:-1]
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
 
-            if key == "order" and value.isdigit():
-                value = int(value)
+        if key == "order" and value.isdigit():
+            value = int(value)
 
-            metadata[key] = value
+        metadata[key] = value
 
-    return metadata, rest_of_content.lstrip()
+    return metadata, content[body_start:].lstrip()
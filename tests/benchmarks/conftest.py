@@ -0,0 +1,117 @@
+"""
+Benchmark harness for the documentation pipeline.
+
+Every benchmark times a callable a few times and compares the median against
+`baseline.json`. A test fails when its median exceeds the baseline by more
+than BURIDAN_BENCH_THRESHOLD (a ratio, 1.5 by default). Baselines are
+machine-specific, so the benchmarks are skipped unless asked for:
+
+    BURIDAN_BENCH=true python -m pytest tests/benchmarks
+
+Refresh the baselines on the machine that tracks them with:
+
+    BURIDAN_BENCH_UPDATE=true python -m pytest tests/benchmarks
+"""
+
+import os
+import json
+import time
+import pathlib
+import statistics
+
+from typing import Callable, Dict
+
+import pytest
+
+BASELINE_PATH = pathlib.Path(__file__).parent / "baseline.json"
+
+THRESHOLD = float(os.environ.get("BURIDAN_BENCH_THRESHOLD", "1.5"))
+UPDATE_BASELINE = os.environ.get("BURIDAN_BENCH_UPDATE") == "true"
+RUN_BENCHMARKS = os.environ.get("BURIDAN_BENCH") == "true" or UPDATE_BASELINE
+
+_results: Dict[str, float] = {}
+
+
+def _read_baseline() -> Dict[str, float]:
+    try:
+        return json.loads(BASELINE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+class Benchmark:
+    def __init__(self, baseline: Dict[str, float]):
+        self.baseline = baseline
+
+    def __call__(
+        self,
+        name: str,
+        func: Callable,
+        rounds: int = 5,
+        number: int = 1,
+        warmup: int = 1,
+    ) -> float:
+        """Times `func` and fails on a regression.
+
+        Each round calls `func` `number` times, so fast stages are measured
+        over a few milliseconds. Returns the median round in ms.
+        """
+        for _ in range(warmup):
+            func()
+
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            timings.append((time.perf_counter() - start) * 1000)
+
+        median = statistics.median(timings)
+        _results[name] = median
+
+        expected = self.baseline.get(name)
+        if not UPDATE_BASELINE and expected is not None:
+            assert median <= expected * THRESHOLD, (
+                f"{name} regressed: {median:.2f} ms vs baseline {expected:.2f} ms "
+                f"(threshold x{THRESHOLD})"
+            )
+        return median
+
+
+def pytest_collection_modifyitems(config, items):
+    if RUN_BENCHMARKS:
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with BURIDAN_BENCH=true")
+    benchmarks_dir = pathlib.Path(__file__).parent
+    for item in items:
+        if benchmarks_dir in item.path.parents:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def benchmark() -> Benchmark:
+    return Benchmark(_read_baseline())
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _results:
+        return
+
+    baseline = _read_baseline()
+    terminalreporter.section("docs pipeline benchmarks")
+    terminalreporter.write_line(f"{'benchmark':<44}{'median ms':>12}{'baseline':>12}")
+    for name, median in sorted(_results.items()):
+        expected = baseline.get(name)
+        expected_str = f"{expected:.2f}" if expected is not None else "-"
+        terminalreporter.write_line(f"{name:<44}{median:>12.2f}{expected_str:>12}")
+
+    if UPDATE_BASELINE:
+        BASELINE_PATH.write_text(
+            json.dumps(
+                {**baseline, **{k: round(v, 3) for k, v in _results.items()}},
+                indent=2,
+                sort_keys=True,
+            )
+            + "\n"
+        )
+        terminalreporter.write_line(f"Baseline updated: {BASELINE_PATH}")
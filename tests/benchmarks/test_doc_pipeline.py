@@ -0,0 +1,117 @@
+import pytest
+
+
+def _synthetic_document(blocks: int) -> str:
+    """A large page alternating prose, headings and directives."""
+    parts = []
+    for i in range(blocks):
+        parts.append(
+            f"## Section {i}\n\n"
+            f"Some prose with `inline code` and a [link](https://example.com/{i}).\n\n"
+            "```python\nprint('hello')\n```\n"
+        )
+        parts.append(f"--DEMO_AND_SINGLE_FUNCTION(component_{i})--\n")
+        parts.append(f'--SHOW_CODE_WITH_LANGUAGE(["component_{i}", "python"])--\n')
+    return "\n".join(parts)
+
+
+@pytest.fixture(scope="module")
+def parser():
+    from src.docs.generator import parser
+
+    return parser
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    from src.docs.corpus import DocCorpus
+    from src.docs.constants import DOCS_BASE_DIR
+
+    return DocCorpus(DOCS_BASE_DIR)
+
+
+@pytest.mark.parametrize("blocks", [100, 2000])
+def test_parse_sections_synthetic(benchmark, parser, blocks):
+    content = _synthetic_document(blocks)
+
+    sections = parser._parse_sections(content)
+    assert len(sections) == blocks * 3
+
+    benchmark(
+        f"parse_sections[{blocks}]",
+        lambda: parser._parse_sections(content),
+        number=max(1, 2000 // blocks),
+    )
+
+
+def test_parse_and_render_all_pages(benchmark, parser, corpus):
+    def run():
+        for page in corpus.pages:
+            parser.parse_and_render(page.body)
+
+    benchmark("parse_and_render[all_pages]", run, rounds=3)
+
+
+def test_parse_frontmatter(benchmark, corpus):
+    from src.utils.frontmatter import parse_frontmatter
+
+    contents = [page.content for page in corpus.pages]
+
+    def run():
+        for content in contents:
+            parse_frontmatter(content)
+
+    benchmark("parse_frontmatter[all_pages]", run, number=20)
+
+
+def test_extract_table_of_content(benchmark, corpus):
+    from src.docs.corpus import extract_table_of_content
+
+    bodies = [page.body for page in corpus.pages]
+
+    def run():
+        for body in bodies:
+            extract_table_of_content(body)
+
+    benchmark("extract_table_of_content[all_pages]", run, number=20)
+
+
+def test_generate_doc_routes(benchmark):
+    from src.docs.manifest import load_route_manifest
+    from src.routes import generate_doc_routes
+
+    def run():
+        # Drop the in-process memo, so each round loads the persisted manifest.
+        load_route_manifest.cache_clear()
+        generate_doc_routes("getting_started", "docs/getting-started/")
+        generate_doc_routes("components", "docs/components/")
+        generate_doc_routes("charts", "docs/charts/")
+
+    benchmark("generate_doc_routes", run, number=20)
+
+
+def test_convert_to_pure_markdown(benchmark, corpus):
+    from scripts.generate_markdown import (
+        COMPONENTS_LIBRARY_DIR,
+        convert_to_pure_markdown,
+        dynamic_load_components,
+    )
+
+    registry = dynamic_load_components(COMPONENTS_LIBRARY_DIR)
+    bodies = [page.body for page in corpus.pages]
+
+    def run():
+        for body in bodies:
+            convert_to_pure_markdown(body, registry)
+
+    benchmark("convert_to_pure_markdown[all_pages]", run, number=20)
+
+
+def test_build_search_index(benchmark, corpus):
+    from src.docs.search import build_search_index, search_items
+
+    items = search_items()
+    index = build_search_index(corpus, items)
+    assert len(index["terms"]) == len(index["postings"])
+
+    benchmark("build_search_index", lambda: build_search_index(corpus, items))
@@ -0,0 +1,14 @@
+import pathlib
+
+import pytest
+
+ROOT_DIR = pathlib.Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="session", autouse=True)
+def project_root():
+    """Docs paths are resolved relative to the project root, like when running
+    the app. Session scoped, so the module fixtures importing the app see it too."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(ROOT_DIR)
+        yield ROOT_DIR
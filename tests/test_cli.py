@@ -0,0 +1,135 @@
+import json
+import pathlib
+
+import pytest
+from typer.testing import CliRunner
+
+from cli.lock import (
+    LOCK_FILE_NAME,
+    MISSING,
+    MODIFIED,
+    OUTDATED,
+    UP_TO_DATE,
+    LockFile,
+    file_status,
+)
+from cli.main import _plan_copies, app
+from cli.manifest import file_hash
+
+BUTTON = pathlib.Path("myapp") / "components" / "ui" / "base" / "button.py"
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """An empty Reflex project named `myapp`, as the working directory."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "rxconfig.py").write_text(
+        'import reflex as rx\n\nconfig = rx.Config(app_name="myapp")\n'
+    )
+    (tmp_path / "myapp").mkdir()
+    return tmp_path
+
+
+def run(*args: str) -> str:
+    result = CliRunner().invoke(app, list(args))
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def read_lock() -> dict:
+    return json.loads(pathlib.Path(LOCK_FILE_NAME).read_text())
+
+
+def test_file_status():
+    assert file_status(None, "a", "b") == MISSING
+    assert file_status("b", "a", "b") == UP_TO_DATE
+    assert file_status("a", "a", "b") == OUTDATED
+    assert file_status("c", "a", "b") == MODIFIED
+    # A file the CLI never wrote counts as modified.
+    assert file_status("c", None, "b") == MODIFIED
+
+
+def test_plan_copies(project):
+    lock = LockFile(project / LOCK_FILE_NAME)
+    library_file = "src/docs/library/base_ui/components/base/button.py"
+    statuses = [
+        (project / state, library_file, f"hash-{state}", state)
+        for state in (MISSING, UP_TO_DATE, OUTDATED, MODIFIED)
+    ]
+
+    copies, kept, up_to_date = _plan_copies(statuses, lock, force=False)
+    assert [dest.name for _, dest in copies] == [MISSING, OUTDATED]
+    assert kept == [(project / MODIFIED, library_file)]
+    assert up_to_date == 1
+    # Kept files keep their locked hash, so they stay modified.
+    assert MODIFIED not in lock.files
+    assert lock.files[OUTDATED] == f"hash-{OUTDATED}"
+
+    copies, kept, _ = _plan_copies(statuses, lock, force=True)
+    assert [dest.name for _, dest in copies] == [MISSING, OUTDATED, MODIFIED]
+    assert kept == []
+    assert lock.files[MODIFIED] == f"hash-{MODIFIED}"
+
+
+def test_add_component_records_installed_files(project):
+    run("add", "component", "button")
+
+    lock = read_lock()
+    assert lock["components"] == ["button"]
+    assert lock["files"][BUTTON.as_posix()] == file_hash(BUTTON)
+    assert run("status").strip().endswith("up to date.")
+
+
+def test_add_component_keeps_local_changes_unless_forced(project):
+    run("add", "component", "button")
+    library_button = BUTTON.read_text()
+    BUTTON.write_text(library_button + "# local change\n")
+
+    output = run("add", "component", "button")
+    assert f"Kept local changes to {BUTTON.as_posix()}" in output
+    assert "-# local change" in output
+    assert BUTTON.read_text().endswith("# local change\n")
+
+    run("add", "component", "button", "--force")
+    assert BUTTON.read_text() == library_button
+
+
+def test_status_and_sync_update_outdated_files(project):
+    run("add", "component", "button")
+    library_button = BUTTON.read_text()
+
+    # As if the library changed since the file was installed.
+    BUTTON.write_text("# installed by an older library\n")
+    lock = read_lock()
+    lock["files"][BUTTON.as_posix()] = file_hash(BUTTON)
+    pathlib.Path(LOCK_FILE_NAME).write_text(json.dumps(lock))
+
+    assert f"{OUTDATED:<10} {BUTTON.as_posix()}" in run("status")
+    run("sync")
+    assert BUTTON.read_text() == library_button
+    assert read_lock()["files"][BUTTON.as_posix()] == file_hash(BUTTON)
+
+
+def test_status_and_sync_restore_missing_files(project):
+    run("add", "component", "button")
+    library_button = BUTTON.read_text()
+    BUTTON.unlink()
+
+    assert f"{MISSING:<10} {BUTTON.as_posix()}" in run("status")
+    run("sync")
+    assert BUTTON.read_text() == library_button
+
+
+def test_sync_keeps_modified_files_unless_forced(project):
+    run("add", "component", "button")
+    library_button = BUTTON.read_text()
+    BUTTON.write_text(library_button + "# local change\n")
+
+    assert f"{MODIFIED:<10} {BUTTON.as_posix()}" in run("status")
+    output = run("sync")
+    assert "1 with local changes kept" in output
+    assert BUTTON.read_text().endswith("# local change\n")
+
+    run("sync", "--force")
+    assert BUTTON.read_text() == library_button
+    assert "modified" not in run("status")
@@ -0,0 +1,21 @@
+from src.docs.highlight import highlight_code, highlighting_enabled
+from src.docs.markdown_tree import markdown_render_mode
+
+
+def test_highlight_code_emits_prefixed_token_classes():
+    html = highlight_code("print(1)", "python")
+    assert html.startswith('<div class="hl">')
+    assert '<span class="hl-nb">print</span>' in html
+    # Unknown languages fall back to plain text.
+    assert "hl-" not in highlight_code("print(1)", "no-such-language").split(">", 1)[1]
+
+
+def test_client_highlighting_turns_islands_into_build(monkeypatch):
+    monkeypatch.delenv("BURIDAN_MARKDOWN_RENDER", raising=False)
+    monkeypatch.delenv("BURIDAN_CODE_HIGHLIGHT", raising=False)
+    assert highlighting_enabled()
+    assert markdown_render_mode() == "islands"
+
+    monkeypatch.setenv("BURIDAN_CODE_HIGHLIGHT", "client")
+    assert not highlighting_enabled()
+    assert markdown_render_mode() == "build"
@@ -0,0 +1,69 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+
+# Types each query one key at a time, which narrows the previous results,
+# then runs every prefix again as a fresh search. Prints the prefixes whose
+# results differ.
+NODE_SCRIPT = """
+const [searchJs, indexJson, queriesJson] = process.argv.slice(2);
+const element = { scrollTop: 0, clientHeight: 0, matches: () => false };
+global.Element = function () {};
+global.document = { addEventListener: () => {}, querySelector: () => element };
+global.window = {};
+require(searchJs);
+const search = window.buridanSearch;
+
+search.open({ index: require(indexJson), rowHeight: 40 }, () => {});
+setTimeout(() => {
+  const mismatches = [];
+  for (const query of JSON.parse(queriesJson)) {
+    const prefixes = [...query].map((_, i) => query.slice(0, i + 1));
+    search.search("");
+    const typed = prefixes.map((prefix) => search.search(prefix));
+    prefixes.forEach((prefix, i) => {
+      search.search("");
+      const fresh = search.search(prefix);
+      if (JSON.stringify(typed[i]) !== JSON.stringify(fresh)) {
+        mismatches.push({ prefix, typed: typed[i], fresh });
+      }
+    });
+  }
+  console.log(JSON.stringify(mismatches));
+}, 0);
+"""
+
+QUERIES = [
+    "sidebar",
+    "chart area",
+    "button group",
+    "client state var",
+    "dark mode toggle",
+    "install cli",
+]
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+def test_incremental_search_matches_fresh_search(project_root, tmp_path):
+    from src.docs.search import search_index
+
+    index_path = tmp_path / "index.json"
+    index_path.write_text(json.dumps(search_index()))
+    script_path = tmp_path / "search_test.js"
+    script_path.write_text(NODE_SCRIPT)
+
+    result = subprocess.run(
+        [
+            "node",
+            script_path,
+            project_root / "assets" / "js" / "search.js",
+            index_path,
+            json.dumps(QUERIES),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert json.loads(result.stdout) == []
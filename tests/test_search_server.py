@@ -0,0 +1,20 @@
+import sqlite3
+
+import pytest
+
+
+def test_search_recovers_once_the_database_is_built(tmp_path, monkeypatch):
+    import src.docs.search_server as search_server
+
+    # A leaked pool slot makes the last query wait for a connection, not hang.
+    monkeypatch.setattr(search_server, "POOL_TIMEOUT", 0.1)
+    database = search_server.SearchDatabase(tmp_path / "search.sqlite3", pool_size=2)
+
+    for _ in range(database.pool_size + 3):
+        with pytest.raises(sqlite3.OperationalError):
+            database.search("button")
+
+    database.build()
+    result = database.search("button")
+    assert result["total"] > 0
+    assert result["results"][0]["url"].startswith("docs/")
@@ -0,0 +1,16 @@
+from src.docs.style import render_codeblock
+
+
+def copy_id(component) -> str:
+    button = component.children[1]
+    return str(button.custom_attrs["data-copy"])
+
+
+def test_identical_code_blocks_get_distinct_copy_ids():
+    first = render_codeblock("print('same')", copy_button=True)
+    second = render_codeblock("print('same')", copy_button=True)
+    other = render_codeblock("print('other')", copy_button=True)
+
+    ids = {copy_id(first), copy_id(second), copy_id(other)}
+    assert len(ids) == 3
+    assert copy_id(second).startswith(copy_id(first))